@@ -0,0 +1,68 @@
+"""
+AgentRegistry:
+    Maps agent names to the functions that create them so a seat can be filled by name
+    (e.g. from a configuration file or command line)
+
+    Built-in agents:
+        * human     HumanAgent(ui)
+        * random    RandomAgent(seed=None)
+        * scripted  ScriptedAgent(script)
+        * callback  CallbackAgent(callback)
+        * equity    EquityAgent(seed=None, num_samples=..., raise_equity=...)
+"""
+
+"""
+Imports
+"""
+from callbackagent  import CallbackAgent
+from equityagent    import EquityAgent
+from humanagent     import HumanAgent
+from randomagent    import RandomAgent
+from scriptedagent  import ScriptedAgent
+
+class AgentRegistry:
+    """
+    Constants
+    """
+    AGENT_HUMAN     = "human"
+    AGENT_RANDOM    = "random"
+    AGENT_SCRIPTED  = "scripted"
+    AGENT_CALLBACK  = "callback"
+    AGENT_EQUITY    = "equity"
+
+    EXCEPTION_UNKNOWN_AGENT = "No agent registered under the name [%s]"
+
+    """
+    Static Variables
+    """
+    _factories = {
+        AGENT_HUMAN     : HumanAgent,
+        AGENT_RANDOM    : RandomAgent,
+        AGENT_SCRIPTED  : ScriptedAgent,
+        AGENT_CALLBACK  : CallbackAgent,
+        AGENT_EQUITY    : EquityAgent
+    }
+
+    """
+    Static Methods
+    """
+    @staticmethod
+    def register(name, factory):
+        """
+        Register a function (or class) that creates an agent under a name (replacing any agent of the same name)
+        """
+        AgentRegistry._factories[name] = factory
+
+    @staticmethod
+    def create(name, *args, **kwargs):
+        """
+        Create an agent by name, passing any other arguments to its factory
+        """
+        if name not in AgentRegistry._factories:
+            raise Exception(AgentRegistry.EXCEPTION_UNKNOWN_AGENT % name)
+
+        return AgentRegistry._factories[name](*args, **kwargs)
+
+    @staticmethod
+    def get_names():
+        return sorted(AgentRegistry._factories.keys())
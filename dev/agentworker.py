@@ -0,0 +1,102 @@
+"""
+AgentWorker:
+    Runs agent decisions on a worker thread so the game can stop waiting for a move once its time limit has passed
+    A thread cannot be stopped, so a decision that runs past its time limit keeps running in the background
+    and its move is thrown away: the worker is retired (its thread ends once the late decision returns)
+    and the game starts a new one for later decisions
+    A worker must be closed once the game is over so its thread does not wait for decisions forever
+"""
+
+"""
+Imports
+"""
+from queue      import Empty, SimpleQueue
+from threading  import Thread
+
+class AgentWorker:
+    """
+    Constructor
+    """
+    def __init__(self):
+        """
+        Properties
+        """
+        self._requests  = SimpleQueue()     ### (agent, view, available moves, action to play) of each decision to make (None to stop the thread)
+        self._results   = SimpleQueue()     ### (chosen move or None, exception raised or None) of each decision made
+        self._retired   = False             ### Did a decision run past its time limit?
+
+        """
+        The worker thread is a daemon thread so that a decision that never returns cannot keep the program running
+        """
+        self._thread        = Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    """
+    Getter Methods
+    """
+    def is_retired(self):
+        return self._retired
+
+    def is_finished(self):
+        """
+        Check if the worker thread has ended (a retired worker's thread ends once its late decision returns)
+        """
+        return not self._thread.is_alive()
+
+    """
+    Public Methods
+    """
+    def choose_move(self, agent, view, available_moves, action_to_play, time_limit):
+        """
+        Ask an agent for a move on the worker thread and wait for it for at most the time limit (in seconds)
+        Return the chosen move, or None if the time limit passed first (the worker is then retired)
+        An exception raised by the agent is raised again here
+        """
+        self._requests.put(( agent, view, available_moves, action_to_play ))
+
+        try:
+            chosen_move, exception = self._results.get(timeout=time_limit)
+        except Empty:
+            """
+            Let the worker thread end once the late decision is made
+            """
+            self._retired = True
+            self._requests.put(None)
+            return None
+
+        if exception is not None:
+            raise exception
+
+        """
+        Return Result
+        """
+        return chosen_move
+
+    def close(self):
+        """
+        Let the worker thread end once it has made the decisions already requested (a retired worker is already ending)
+        """
+        if not self._retired:
+            self._retired = True
+            self._requests.put(None)
+
+    """
+    Private Methods
+    """
+    def _run(self):
+        """
+        Make each requested decision in order until the worker is retired
+        """
+        while True:
+            request = self._requests.get()
+
+            if request is None:
+                return
+
+            agent, view, available_moves, action_to_play = request
+
+            try:
+                self._results.put(( agent.choose_move(view, available_moves, action_to_play), None ))
+            except Exception as exception:
+                self._results.put(( None, exception ))
@@ -0,0 +1,106 @@
+"""
+BatchEvaluator:
+    Evaluates many hands at once with NumPy, giving the same strengths as HandEvaluator
+    Hands are given as an (N, 5), (N, 6) or (N, 7) integer array of card indices (see Card.get_index)
+    and every step (suit counters, rank products, table lookups) runs on whole columns instead of one hand at a time
+    NumPy is only required if this module is used
+"""
+
+"""
+Imports
+"""
+import numpy
+
+from card           import Card
+from handevaluator  import HandEvaluator
+
+class BatchEvaluator:
+    """
+    Constants
+    """
+    MIN_CARDS = HandEvaluator.HAND_SIZE
+    MAX_CARDS = HandEvaluator.MAX_CARDS
+
+    EXCEPTION_BAD_SHAPE = "Expected an array of shape (N, %d to %d) of card indices but got shape %s"
+
+    """
+    Lookup Tables (populated by _build_tables when the module is imported)
+    """
+    _card_primes        = None  ### Card index -> rank prime
+    _card_rank_bits     = None  ### Card index -> rank bit
+    _card_suit_counters = None  ### Card index -> 1 in the card's 4-bit suit counter (see the card code layout in Card)
+    _flush_best_table   = None  ### Rank bit pattern of 5 to 7 suited cards -> strength of the best flush
+    _rank_keys          = None  ### Sorted products of rank primes of 5 to 7 cards
+    _rank_strengths     = None  ### Strength of the best non-flush hand of each product in _rank_keys
+
+    """
+    Static Methods
+    """
+    @staticmethod
+    def to_indices(hands):
+        """
+        Convert a list of hands (each a list of cards of the same length) to an array of card indices
+        """
+        return numpy.array([ [ card.get_index() for card in hand ] for hand in hands ], dtype=numpy.intp)
+
+    @staticmethod
+    def evaluate(cards):
+        """
+        Get the strength of the best hand in each row of an (N, 5), (N, 6) or (N, 7) array of card indices
+        Return an (N,) array of strengths
+        """
+        cards = numpy.asarray(cards, dtype=numpy.intp)
+
+        if cards.ndim != 2 or not BatchEvaluator.MIN_CARDS <= cards.shape[1] <= BatchEvaluator.MAX_CARDS:
+            raise Exception(BatchEvaluator.EXCEPTION_BAD_SHAPE % (BatchEvaluator.MIN_CARDS, BatchEvaluator.MAX_CARDS, cards.shape))
+
+        """
+        Non-flush hands: the product of the rank primes identifies the multiset of values
+        """
+        products    = BatchEvaluator._card_primes[cards].prod(axis=1)
+        strengths   = BatchEvaluator._rank_strengths[ numpy.searchsorted(BatchEvaluator._rank_keys, products) ]
+
+        """
+        Flush hands: add up the suit counters (the high bit of a biased counter is set if its suit has 5 or more cards)
+        and look up the rank bits of the cards in that suit
+        """
+        suit_counters   = BatchEvaluator._card_suit_counters[cards]
+        flush_bits      = ( suit_counters.sum(axis=1) + HandEvaluator.FLUSH_COUNTER_BIAS ) & HandEvaluator.FLUSH_COUNTER_MASK
+        flush_rows      = numpy.nonzero(flush_bits)[0]
+
+        if len(flush_rows) > 0:
+            flush_counters      = ( flush_bits[flush_rows] >> ( Card.SUIT_COUNTER_BITS - 1 ) )[:, numpy.newaxis]
+            suited_rank_bits    = numpy.where(
+                suit_counters[flush_rows] == flush_counters,
+                BatchEvaluator._card_rank_bits[ cards[flush_rows] ],
+                0
+            )
+
+            strengths[flush_rows] = BatchEvaluator._flush_best_table[ numpy.bitwise_or.reduce(suited_rank_bits, axis=1) ]
+
+        """
+        Return Result
+        """
+        return strengths
+
+    """
+    Private Methods
+    """
+    @staticmethod
+    def _build_tables():
+        """
+        Copy HandEvaluator's lookup tables into arrays that can be indexed by whole columns
+        """
+        BatchEvaluator._card_primes         = numpy.array([ card.get_prime() for card in Card.DECK ], dtype=numpy.int64)
+        BatchEvaluator._card_rank_bits      = numpy.array([ 1 << ( card.get_value() - Card.VALUES[0] ) for card in Card.DECK ], dtype=numpy.int32)
+        BatchEvaluator._card_suit_counters  = numpy.array([ 1 << ( Card.SUIT_COUNTER_BITS * card.get_suit() ) for card in Card.DECK ], dtype=numpy.int32)
+        BatchEvaluator._flush_best_table    = numpy.array(HandEvaluator._flush_best_table, dtype=numpy.int32)
+
+        rank_items                          = sorted(HandEvaluator._rank_table.items())
+        BatchEvaluator._rank_keys           = numpy.array([ product for product, _ in rank_items ], dtype=numpy.int64)
+        BatchEvaluator._rank_strengths      = numpy.array([ strength for _, strength in rank_items ], dtype=numpy.int32)
+
+"""
+Build lookup tables once at import
+"""
+BatchEvaluator._build_tables()
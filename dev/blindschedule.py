@@ -0,0 +1,83 @@
+"""
+BlindSchedule:
+    Precomputed table of the big blind and ante of every blind level (round number)
+    The table is built once, so the blinds of any round are found by index instead of replaying the blind increase scheme
+    Levels are reached by round number: the game moves to the next round when its blind timer (real or virtual) goes off
+    or after a set number of hands (see get_round_number_at)
+"""
+
+class BlindSchedule:
+    """
+    Constants
+    """
+    INITIAL_ROUND_NUMBER    = 1         ### Round number of the first level
+
+    EXCEPTION_NO_LEVELS = "A blind schedule needs at least one level"
+
+    """
+    Constructor
+    """
+    def __init__(self, levels):
+        """
+        Properties
+        """
+        self._levels = tuple([ ( big_blind, ante ) for big_blind, ante in levels ])   ### (big blind, ante) of each level in order
+
+        if len(self._levels) == 0:
+            raise Exception(BlindSchedule.EXCEPTION_NO_LEVELS)
+
+    """
+    Static Methods
+    """
+    @staticmethod
+    def from_scheme(starting_big_blind, blind_increase_scheme, max_big_blind, ante_ratio=0):
+        """
+        Build the schedule by applying a blind increase scheme until the big blind reaches the maximum
+        (or until the scheme stops raising it)
+        parameter ante_ratio: Size of the ante at each level as a fraction of the big blind (no antes by default)
+        """
+        big_blinds = [ starting_big_blind ]
+
+        while big_blinds[-1] < max_big_blind:
+            big_blind = blind_increase_scheme(big_blinds[-1], starting_big_blind)
+
+            if big_blind <= big_blinds[-1]:
+                break
+
+            big_blinds.append(big_blind)
+
+        """
+        Return Result
+        """
+        return BlindSchedule([ ( big_blind, big_blind * ante_ratio ) for big_blind in big_blinds ])
+
+    @staticmethod
+    def get_round_number_at(elapsed, level_length):
+        """
+        Get the round number after the given amount of hands or (virtual) time, with levels of the given length
+        """
+        return int(elapsed // level_length) + BlindSchedule.INITIAL_ROUND_NUMBER
+
+    """
+    Getter Methods
+    """
+    def get_level(self, round_number):
+        """
+        Get the (big blind, ante) of a round (rounds after the last level stay at the last level)
+        """
+        level_idx = min(max(round_number, BlindSchedule.INITIAL_ROUND_NUMBER), len(self._levels)) - BlindSchedule.INITIAL_ROUND_NUMBER
+        return self._levels[level_idx]
+
+    def get_big_blind(self, round_number):
+        big_blind, _ = self.get_level(round_number)
+        return big_blind
+
+    def get_ante(self, round_number):
+        _, ante = self.get_level(round_number)
+        return ante
+
+    def is_final_level(self, round_number):
+        """
+        Check if the blinds will not be raised any higher after the given round
+        """
+        return round_number - BlindSchedule.INITIAL_ROUND_NUMBER >= len(self._levels) - 1
@@ -0,0 +1,26 @@
+"""
+CallbackAgent:
+    Adapts a decision function to the PokerAgent interface
+    The function is called as callback(player, available_moves, action_to_play) with the acting player's PlayerView
+"""
+
+"""
+Imports
+"""
+from pokeragent import PokerAgent
+
+class CallbackAgent(PokerAgent):
+    """
+    Constructor
+    """
+    def __init__(self, callback):
+        """
+        Properties
+        """
+        self._callback = callback   ### Function that chooses the moves
+
+    """
+    Public Methods
+    """
+    def choose_move(self, view, available_moves, action_to_play):
+        return self._callback(view.get_player(), available_moves, action_to_play)
@@ -1,9 +1,15 @@
 """
 Card:
     Represents a standard playing card
+    There is exactly one immutable instance of each of the 52 cards, so cards can be shared instead of copied
 """
 
 class Card:
+    """
+    Slots (no instance dictionary: cards are small, cheap to hash, and cannot be modified)
+    """
+    __slots__ = ( "_suit", "_value", "_index", "_code" )
+
     """
     Contants
     """
@@ -20,19 +26,67 @@ class Card:
     ACE_HIGH_VALUE      = 14
     ACE_LOW_VALUE       = 14
 
+    NUM_CARDS           = len(SUIT_NAMES) * len(VALUES)
+
     """
-    Constructor
+    Card code layout (one integer per card):
+
+    -------------------------------------------------------
+    | Bits  | Contents                                    |
+    -------------------------------------------------------
+    | 0-7   | Prime number for the card's rank (2 -> 41)  |
+    | 8-11  | Rank index (0 for a deuce -> 12 for an ace) |
+    | 12-15 | Suit bit (one bit per suit)                 |
+    | 16-28 | Rank bit (one bit per rank)                 |
+    | 32-47 | Suit counter (one 4-bit counter per suit)   |
+    -------------------------------------------------------
+
+    Adding up to 7 codes never carries into the suit counters, so the sum of the codes counts the cards of each suit
     """
-    def __init__(self, suit, value):
-        """
-        Properties
-        """
-        self._suit  = suit  ### Card's suit
-        self._value = value ### Card's numeric value
+    RANK_PRIMES         = [ 2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41 ]
+    PRIME_MASK          = 0xFF
+    RANK_SHIFT          = 8
+    RANK_MASK           = 0xF
+    SUIT_SHIFT          = 12
+    SUIT_MASK           = 0xF000
+    RANK_BIT_SHIFT      = 16
+    RANK_BITS_MASK      = 0x1FFF
+    SUIT_COUNTER_SHIFT  = 32
+    SUIT_COUNTER_BITS   = 4
+
+    EXCEPTION_IMMUTABLE = "Cards cannot be modified"
+
+    DECK                = tuple()   ### Every card instance, ordered by index (populated below the class)
+
+    """
+    Constructor:
+        Cards are interned, so "creating" a card returns the single shared instance of that card
+        (the suit and value may only be omitted by the unpickler, which restores them with __setstate__)
+    """
+    def __new__(cls, suit=None, value=None):
+
+        if suit is None or value is None:
+            return object.__new__(cls)
+
+        return Card.DECK[ Card.get_index_of(suit, value) ]
 
     """
     Static Methods
     """
+    @staticmethod
+    def get_index_of(suit, value):
+        """
+        Get the index (0-51) of the card with the given suit and value
+        """
+        return suit * len(Card.VALUES) + ( value - Card.VALUES[0] )
+
+    @staticmethod
+    def from_index(index):
+        """
+        Get the card at the given index (0-51)
+        """
+        return Card.DECK[index]
+
     @staticmethod
     def get_value_str(value):
         """
@@ -63,6 +117,42 @@ class Card:
         """
         return self._value < other._value
 
+    def __eq__(self, other):
+        """
+        = if both cards have the same suit and value
+        """
+        return isinstance(other, Card) and self._index == other._index
+
+    def __hash__(self):
+        return self._index
+
+    def __setattr__(self, name, value):
+        """
+        Cards are immutable
+        """
+        raise AttributeError(Card.EXCEPTION_IMMUTABLE)
+
+    def __copy__(self):
+        """
+        Cards are immutable, so a copy is the card itself
+        """
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        """
+        Pickle a card by its suit and value so that unpickling returns the shared instance
+        """
+        return (Card, (self._suit, self._value))
+
+    def __setstate__(self, state):
+        """
+        Restore a card pickled before cards were interned (state is a dictionary of the old properties)
+        """
+        Card._init_slots(self, state["_suit"], state["_value"])
+
     def __str__(self):
         """
         String representation of the card
@@ -92,3 +182,47 @@ class Card:
 
     def get_value(self):
         return self._value
+
+    def get_index(self):
+        return self._index
+
+    def get_code(self):
+        return self._code
+
+    def get_prime(self):
+        return self._code & Card.PRIME_MASK
+
+    """
+    Private Methods
+    """
+    @staticmethod
+    def _init_slots(card, suit, value):
+        """
+        Set the (otherwise immutable) properties of a card instance
+        """
+        rank_idx = value - Card.VALUES[0]
+
+        object.__setattr__(card, "_suit",   suit)                               ### Card's suit
+        object.__setattr__(card, "_value",  value)                              ### Card's numeric value
+        object.__setattr__(card, "_index",  Card.get_index_of(suit, value))     ### Card's position in a sorted deck (0-51)
+        object.__setattr__(card, "_code",                                       ### Card's integer code for hand evaluation
+            Card.RANK_PRIMES[rank_idx]
+            | ( rank_idx << Card.RANK_SHIFT )
+            | ( 1 << ( Card.SUIT_SHIFT + suit ) )
+            | ( 1 << ( Card.RANK_BIT_SHIFT + rank_idx ) )
+            | ( 1 << ( Card.SUIT_COUNTER_SHIFT + Card.SUIT_COUNTER_BITS * suit ) )
+        )
+
+    @staticmethod
+    def _create(suit, value):
+        """
+        Create a card instance without going through interning (only used to build the deck table)
+        """
+        card = object.__new__(Card)
+        Card._init_slots(card, suit, value)
+        return card
+
+"""
+Create the single shared instance of every card
+"""
+Card.DECK = tuple( Card._create(suit, value) for suit in range(len(Card.SUIT_NAMES)) for value in Card.VALUES )
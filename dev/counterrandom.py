@@ -0,0 +1,96 @@
+"""
+CounterRandom:
+    Counter-based random number generator
+    The n-th number of a stream is a pure function of the stream's key and n (SplitMix64 mixing), so:
+        * Streams with different keys are independent and share no state (no locking between parallel workers)
+        * The generator state is two integers and can be saved or restored in O(1)
+"""
+
+"""
+Imports
+"""
+from random import Random
+
+class CounterRandom(Random):
+    """
+    Constants
+    """
+    MASK_64         = ( 1 << 64 ) - 1
+    GOLDEN_GAMMA    = 0x9E3779B97F4A7C15    ### Counter increment (odd, so every 64-bit value is visited)
+    MIX_MULTIPLIER1 = 0xBF58476D1CE4E5B9
+    MIX_MULTIPLIER2 = 0x94D049BB133111EB
+    FLOAT_BITS      = 53                    ### Number of random bits in a float
+    WORD_BITS       = 64
+
+    """
+    Constructor
+    """
+    def __init__(self, seed=None):
+        """
+        Properties
+        """
+        self._key       = 0     ### Stream key (derived from the seed)
+        self._counter   = 0     ### Number of 64-bit words drawn from the stream
+
+        super().__init__(seed)
+
+    """
+    Static Methods
+    """
+    @staticmethod
+    def mix(value):
+        """
+        SplitMix64 finalizer: scramble a 64-bit value so that nearby inputs give unrelated outputs
+        """
+        value = ( ( value ^ ( value >> 30 ) ) * CounterRandom.MIX_MULTIPLIER1 ) & CounterRandom.MASK_64
+        value = ( ( value ^ ( value >> 27 ) ) * CounterRandom.MIX_MULTIPLIER2 ) & CounterRandom.MASK_64
+        return value ^ ( value >> 31 )
+
+    """
+    Random Overrides
+    """
+    def seed(self, a=None, version=2):
+        """
+        Start a new stream: the key is derived from the seed and the counter starts at 0
+        Non-integer seeds are reduced to an integer with the standard generator's seeding
+        """
+        if not isinstance(a, int):
+            a = Random(a).getrandbits(CounterRandom.WORD_BITS)
+
+        self._key       = CounterRandom.mix(a & CounterRandom.MASK_64)
+        self._counter   = 0
+
+    def random(self):
+        """
+        Get a float in [0, 1) from the next 64-bit word
+        """
+        return ( self._next_word() >> ( CounterRandom.WORD_BITS - CounterRandom.FLOAT_BITS ) ) * ( 1.0 / ( 1 << CounterRandom.FLOAT_BITS ) )
+
+    def getrandbits(self, k):
+        """
+        Get an integer with k random bits from as many 64-bit words as needed
+        """
+        result      = 0
+        num_bits    = 0
+
+        while num_bits < k:
+            result      |= self._next_word() << num_bits
+            num_bits    += CounterRandom.WORD_BITS
+
+        return result & ( ( 1 << k ) - 1 )
+
+    def getstate(self):
+        return (self._key, self._counter)
+
+    def setstate(self, state):
+        self._key, self._counter = state
+
+    """
+    Private Methods
+    """
+    def _next_word(self):
+        """
+        Mix the key with the counter position and advance the counter
+        """
+        self._counter += 1
+        return CounterRandom.mix( ( self._key + self._counter * CounterRandom.GOLDEN_GAMMA ) & CounterRandom.MASK_64 )
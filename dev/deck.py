@@ -1,58 +1,98 @@
 """
 Deck:
     Represents a workable deck of standard playing cards
+
+    The deck is a fixed array of the 52 shared card instances with a cursor pointing at the next card to draw
+    Shuffling is lazy: a shuffled deck performs one Fisher-Yates step per draw, so only the cards that are
+    actually dealt are ever moved and nothing is allocated between hands
 """
 
 """
 Imports
 """
-from random import shuffle
+from random import Random
 
-from card 	import Card
+from card   import Card
 
 class Deck:
     """
     Constructor
     """
-    def __init__(self):
+    def __init__(self, rng=None):
         """
         Properties
         """
-        self._cards = list()    ### Collection of card objects
-
-        self.reset()
+        self._cards     = list(Card.DECK)                       ### Fixed array of every card (cards before the cursor have been drawn)
+        self._cursor    = 0                                     ### Position of the next card to draw
+        self._rng       = rng if rng is not None else Random()  ### Random number generator used to shuffle
+        self._shuffled  = False                                 ### Are the undrawn cards in a random order?
 
     """
     Public Methods
     """
     def reset(self):
         """
-        Create a card for each suit and each value and add them to the list (deck)
+        Return every drawn card to the deck in sorted order (no cards are created)
         """
-        self._cards.clear()
+        self._cards[:]  = Card.DECK
+        self._cursor    = 0
+        self._shuffled  = False
 
-        for suit in range(len(Card.SUIT_NAMES)):
-
-            for value in Card.VALUES:
-                self._cards.append( Card(suit, value) )
+    def seed(self, seed):
+        """
+        Reseed the random number generator so the next shuffle can be reproduced
+        """
+        self._rng.seed(seed)
 
     def shuffle(self):
         """
-        Randomize the order of the cards
+        Randomize the order of the cards that have not been drawn yet
+        The actual swaps happen one at a time as cards are drawn
         """
-        shuffle(self._cards)
+        self._shuffled = True
 
     def draw_card(self):
         """
         Remove a card from the deck and return it
         Return None if there are no available cards
         """
-        card = None
+        card        = None
+        cursor      = self._cursor
+        num_cards   = len(self._cards)
+
+        if cursor < num_cards:
+            cards = self._cards
 
-        if len(self._cards) > 0:
-            card = self._cards.pop(0)
+            """
+            Fisher-Yates step: swap a random undrawn card into the cursor position
+            """
+            if self._shuffled:
+                swap_idx                            = cursor + int( self._rng.random() * ( num_cards - cursor ) )
+                cards[cursor], cards[swap_idx]      = cards[swap_idx], cards[cursor]
+
+            card            = cards[cursor]
+            self._cursor    = cursor + 1
 
         """
         Return Result
         """
         return card
+
+    def get_cursor(self):
+        """
+        Get the number of cards that have been drawn (the position of the next card to draw)
+        """
+        return self._cursor
+
+    def return_cards(self, cursor):
+        """
+        Return every card drawn after the given cursor position to the deck (e.g. to undo a look-ahead)
+        The returned cards are undrawn again, so a shuffled deck may deal different cards in their place
+        """
+        self._cursor = cursor
+
+    def get_num_remaining(self):
+        """
+        Get the number of cards that have not been drawn yet
+        """
+        return len(self._cards) - self._cursor
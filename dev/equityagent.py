@@ -0,0 +1,75 @@
+"""
+EquityAgent:
+    AI that plays by comparing its estimated equity against the price of continuing
+        * Bets or raises with strong equity
+        * Calls (or checks) when its equity is at least the share of the final pot it has to put in (the pot odds)
+        * Checks or folds otherwise
+"""
+
+"""
+Imports
+"""
+from random             import Random
+
+from equitycalculator   import EquityCalculator
+from gamemove           import GameMove
+from pokeragent         import PokerAgent
+
+class EquityAgent(PokerAgent):
+    """
+    Constants
+    """
+    DEFAULT_NUM_SAMPLES     = 1000  ### Number of trials used to estimate equity
+    DEFAULT_RAISE_EQUITY    = 0.7   ### Smallest equity worth betting or raising with
+    TIME_BUDGET_SHARE       = 0.5   ### Share of the decision time limit spent estimating equity
+    USES_EQUITY             = True  ### The game estimates the agent's equity for each view
+
+    """
+    Constructor
+    """
+    def __init__(self, seed=None, num_samples=DEFAULT_NUM_SAMPLES, raise_equity=DEFAULT_RAISE_EQUITY):
+        """
+        Properties
+        """
+        self._calculator    = EquityCalculator(rng=Random(seed))    ### Estimates the equity of the agent's hole cards
+        self._num_samples   = num_samples                           ### Number of trials used to estimate equity (if the view has no estimate)
+        self._raise_equity  = raise_equity                          ### Smallest equity worth betting or raising with
+
+    """
+    Public Methods
+    """
+    def choose_move(self, view, available_moves, action_to_play):
+        """
+        Use the equity the game estimated for the view, or estimate equity against the opponents still in the hand
+        within the time budget (e.g. if the agent is used outside of a game)
+        """
+        equity = view.equity
+
+        if equity is None:
+            time_budget = view.time_budget * EquityAgent.TIME_BUDGET_SHARE if view.time_budget is not None else None
+            equity      = self._calculator.calculate(
+                view.get_player().get_hole_cards(),
+                board           = view.board,
+                num_opponents   = max(view.get_num_opponents(), 1),
+                num_samples     = self._num_samples,
+                time_budget     = time_budget
+            ).get_equity()
+
+        """
+        Compare the equity with the pot odds of calling
+        """
+        amount_to_call  = view.get_amount_to_call()
+        pot_odds        = amount_to_call / ( view.get_total_pot() + amount_to_call ) if amount_to_call > 0 else 0.0
+        chosen_move     = PokerAgent.get_passive_move(available_moves)
+
+        if equity >= self._raise_equity and GameMove.RAISE in available_moves:
+            chosen_move = (GameMove.RAISE, action_to_play)
+        elif equity >= self._raise_equity and GameMove.BET in available_moves:
+            chosen_move = (GameMove.BET, action_to_play)
+        elif equity >= pot_odds and GameMove.CALL in available_moves:
+            chosen_move = (GameMove.CALL, None)
+
+        """
+        Return Result
+        """
+        return chosen_move
@@ -0,0 +1,373 @@
+"""
+EquityCalculator:
+    Calculates how often a hand wins against its opponents, either:
+        * Estimated by sampling the remaining deck (Monte Carlo), or
+        * Exactly, by enumerating every possible completion of the board (flop, turn, and river spots)
+
+    Sampled cards are drawn in sets of up to three from tables of every such set in the deck (built once at import),
+    each with its card mask, rank prime product, and code sum, so dealing a trial is a few table draws and
+    scoring a hand is a multiply and a table lookup instead of a pass over its seven cards
+"""
+
+"""
+Imports
+"""
+from itertools      import combinations
+from random         import Random
+from time           import perf_counter
+
+from card           import Card
+from equityresult   import EquityResult
+from handevaluator  import HandEvaluator
+
+class EquityCalculator:
+    """
+    Constants
+    """
+    BOARD_SIZE          = 5         ### Number of community cards on a complete board
+    NUM_HOLE_CARDS      = 2         ### Number of hole cards per player
+    DEFAULT_NUM_SAMPLES = 10000     ### Number of trials to run if no sample or time budget is given
+    BATCH_SIZE          = 1000      ### Number of trials run between checks of the time budget
+    MAX_SET_SIZE        = 3         ### Largest number of cards drawn from the deck at once when sampling
+    MIN_EXACT_BOARD     = 4         ### Smallest known board enumerated exactly in-line against an unknown opponent (turn)
+    MIN_EXACT_VS_KNOWN  = 3         ### Smallest known board enumerated exactly in-line against known opponent hands (flop)
+
+    EXCEPTION_NOT_ENOUGH_CARDS = "Not enough cards remain in the deck to deal %d cards"
+
+    """
+    Lookup Tables (populated by _build_tables when the module is imported)
+    """
+    _card_sets = dict() ### Number of cards -> (card mask, rank prime product, code sum, codes) of every set of that many cards in the deck
+
+    """
+    Constructor
+    """
+    def __init__(self, rng=None):
+        """
+        Properties
+        """
+        self._rng = rng if rng is not None else Random()  ### Random number generator used to sample cards
+
+    """
+    Static Methods
+    """
+    @staticmethod
+    def is_exact_cheap(board, opponent_hands=None):
+        """
+        Check if enumerating a spot exactly is cheap enough to run in-line (while a player is choosing a move):
+        on the turn or river, or on the flop against known opponent hands
+        Other spots take seconds or more to enumerate (preflop against an unknown opponent, effectively forever) and should be sampled
+        """
+        min_board = EquityCalculator.MIN_EXACT_BOARD if opponent_hands is None else EquityCalculator.MIN_EXACT_VS_KNOWN
+        return len(board) >= min_board
+
+    """
+    Public Methods
+    """
+    def seed(self, seed):
+        """
+        Reseed the random number generator so a sampled estimate can be reproduced
+        """
+        self._rng.seed(seed)
+
+    def calculate(self, hole_cards, board=list(), dead_cards=list(), num_opponents=1, num_samples=None, time_budget=None):
+        """
+        Estimate the equity of the hole cards on the given (partial) board against a number of opponents
+        Dead cards are known to be out of the deck (e.g. folded or exposed cards)
+        Sampling stops after the sample budget is used or the time budget (in seconds) has passed, whichever is first
+        """
+        known_mask = self._prepare(hole_cards, board, dead_cards, num_opponents)
+
+        if num_samples is None and time_budget is None:
+            num_samples = EquityCalculator.DEFAULT_NUM_SAMPLES
+
+        """
+        Run batches of trials until a budget runs out
+        """
+        result      = EquityResult()
+        hole_codes  = [ card.get_code() for card in hole_cards ]
+        board_codes = [ card.get_code() for card in board ]
+        deadline    = perf_counter() + time_budget if time_budget is not None else None
+        num_trials  = 0
+
+        while num_samples is None or num_trials < num_samples:
+            batch_size  = EquityCalculator.BATCH_SIZE if num_samples is None else min(EquityCalculator.BATCH_SIZE, num_samples - num_trials)
+            num_trials  += batch_size
+
+            result.merge( self.run_trials(hole_codes, board_codes, known_mask, num_opponents, batch_size) )
+
+            if deadline is not None and perf_counter() >= deadline:
+                break
+
+        """
+        Return Result
+        """
+        return result
+
+    def calculate_exact(self, hole_cards, board=list(), dead_cards=list(), opponent_hands=None, first_card=None):
+        """
+        Calculate the exact equity of the hole cards by enumerating every possible completion of the board
+        If the opponents' hole cards are not given, every possible hole card combination of a single opponent is enumerated as well
+        If a first card is given, only the runouts whose first card (in deck order) is that card are counted,
+        so the runouts can be split into independent parts
+
+        Each runout is built one card at a time on top of the previous cards' summary,
+        so the work on a partial board is shared by every runout that starts with it
+        """
+        known_cards = set(hole_cards) | set(board) | set(dead_cards)
+
+        for opponent_hand in opponent_hands or list():
+            known_cards |= set(opponent_hand)
+
+        remaining_cards = [ card for card in Card.DECK if card not in known_cards ]
+        num_board_cards = EquityCalculator.BOARD_SIZE - len(board)
+        num_to_deal     = num_board_cards + ( 0 if opponent_hands is not None else EquityCalculator.NUM_HOLE_CARDS )
+
+        if num_to_deal > len(remaining_cards):
+            raise Exception(EquityCalculator.EXCEPTION_NOT_ENOUGH_CARDS % num_to_deal)
+
+        """
+        Summarize the hero's hole cards, the known board, and each possible card to deal
+        """
+        get_partial         = HandEvaluator.get_partial
+        evaluate_partials   = HandEvaluator.evaluate_partials
+        hero_partial        = get_partial([ card.get_code() for card in hole_cards ])
+        board_partial       = get_partial([ card.get_code() for card in board ])
+        card_partials       = [ get_partial([ card.get_code() ]) for card in remaining_cards ]
+        card_masks          = [ 1 << card.get_index() for card in remaining_cards ]
+        result              = EquityResult(exact=True)
+
+        """
+        Summarize the opponents' hole cards: the known hands, or every pair of remaining cards for a single unknown opponent
+        """
+        if opponent_hands is not None:
+            opponent_partials = [ get_partial([ card.get_code() for card in opponent_hand ]) for opponent_hand in opponent_hands ]
+        else:
+            opponent_combos = [
+                ( card_masks[first_idx] | card_masks[second_idx], HandEvaluator.combine_partials(card_partials[first_idx], card_partials[second_idx]) )
+                for first_idx, second_idx in combinations(range(len(remaining_cards)), EquityCalculator.NUM_HOLE_CARDS)
+            ]
+
+        """
+        Score every runout (or only the runouts starting with the first card)
+        """
+        runout_start_idx    = 0
+        runout_mask         = 0
+
+        if first_card is not None and num_board_cards > 0:
+            first_idx           = remaining_cards.index(first_card)
+            board_partial       = HandEvaluator.combine_partials(board_partial, card_partials[first_idx])
+            runout_start_idx    = first_idx + 1
+            runout_mask         = card_masks[first_idx]
+            num_board_cards     -= 1
+
+        for runout_mask, runout_partial in self._enumerate_runouts(board_partial, card_partials, card_masks, num_board_cards, runout_start_idx, runout_mask):
+            hero_strength = evaluate_partials(hero_partial, runout_partial)
+
+            if opponent_hands is not None:
+                opponent_strengths = [ evaluate_partials(opponent_partial, runout_partial) for opponent_partial in opponent_partials ]
+                self._record_trial(result, hero_strength, opponent_strengths)
+
+            else:
+                for combo_mask, combo_partial in opponent_combos:
+                    """
+                    Skip opponent hole cards that were dealt to the board in this runout
+                    """
+                    if combo_mask & runout_mask:
+                        continue
+
+                    self._record_trial(result, hero_strength, [ evaluate_partials(combo_partial, runout_partial) ])
+
+        """
+        Return Result
+        """
+        return result
+
+    def run_trials(self, hole_codes, board_codes, known_mask, num_opponents, num_trials):
+        """
+        Run a batch of trials on card codes: each trial deals the missing board cards followed by each opponent's hole cards
+        Cards are dealt by drawing sets from the card set tables (a set holding a card that is already out is drawn again),
+        so every trial deals a uniformly random selection of the cards left out of the known mask
+        """
+        random          = self._rng.random
+        evaluate_best   = HandEvaluator.evaluate_best_codes
+        rank_table      = HandEvaluator.get_rank_table()
+        counter_shift   = Card.SUIT_COUNTER_SHIFT
+        flush_bias      = HandEvaluator.FLUSH_COUNTER_BIAS
+        flush_mask      = HandEvaluator.FLUSH_COUNTER_MASK
+        wins            = 0
+        ties            = 0
+        losses          = 0
+        equity_sum      = 0.0
+        equity_sq_sum   = 0.0
+
+        """
+        Deal the missing board cards in sets of the largest size and the hole cards in pairs
+        """
+        num_board_cards = EquityCalculator.BOARD_SIZE - len(board_codes)
+        max_set_size    = EquityCalculator.MAX_SET_SIZE
+        set_sizes       = [ max_set_size ] * ( num_board_cards // max_set_size ) + ( [ num_board_cards % max_set_size ] if num_board_cards % max_set_size else list() )
+        board_sets      = [ ( EquityCalculator._card_sets[set_size], len(EquityCalculator._card_sets[set_size]) ) for set_size in set_sizes ]
+        hole_sets       = EquityCalculator._card_sets[EquityCalculator.NUM_HOLE_CARDS]
+        num_hole_sets   = len(hole_sets)
+
+        """
+        Summarize the hero's hole cards and the known board
+        """
+        hero_codes                  = tuple(hole_codes)
+        hero_product, hero_sum, _   = HandEvaluator.get_partial(hole_codes)
+        known_product, known_sum, _ = HandEvaluator.get_partial(board_codes)
+        known_codes                 = tuple(board_codes)
+
+        for _ in range(num_trials):
+            """
+            Deal the board
+            """
+            used_mask       = known_mask
+            board_product   = known_product
+            board_sum       = known_sum
+            full_board      = known_codes
+
+            for card_sets, num_sets in board_sets:
+                set_mask, set_product, set_sum, set_codes = card_sets[ int(random() * num_sets) ]
+
+                while set_mask & used_mask:
+                    set_mask, set_product, set_sum, set_codes = card_sets[ int(random() * num_sets) ]
+
+                used_mask       |= set_mask
+                board_product   *= set_product
+                board_sum       += set_sum
+                full_board      += set_codes
+
+            """
+            Score the hero's hand (only a flush needs the individual cards)
+            """
+            if ( ( ( hero_sum + board_sum ) >> counter_shift ) + flush_bias ) & flush_mask:
+                hero_strength = evaluate_best(hero_codes + full_board)
+            else:
+                hero_strength = rank_table[ hero_product * board_product ]
+
+            num_winners = 1
+
+            """
+            Deal and compare against each opponent: any better hand loses the trial, equal hands split it
+            """
+            for _ in range(num_opponents):
+                set_mask, set_product, set_sum, set_codes = hole_sets[ int(random() * num_hole_sets) ]
+
+                while set_mask & used_mask:
+                    set_mask, set_product, set_sum, set_codes = hole_sets[ int(random() * num_hole_sets) ]
+
+                used_mask |= set_mask
+
+                if ( ( ( set_sum + board_sum ) >> counter_shift ) + flush_bias ) & flush_mask:
+                    opponent_strength = evaluate_best(set_codes + full_board)
+                else:
+                    opponent_strength = rank_table[ set_product * board_product ]
+
+                if opponent_strength > hero_strength:
+                    num_winners = 0
+                    break
+                elif opponent_strength == hero_strength:
+                    num_winners += 1
+
+            """
+            Record the trial
+            """
+            if num_winners == 0:
+                losses += 1
+            elif num_winners == 1:
+                wins            += 1
+                equity_sum      += 1.0
+                equity_sq_sum   += 1.0
+            else:
+                share           = 1.0 / num_winners
+                ties            += 1
+                equity_sum      += share
+                equity_sq_sum   += share * share
+
+        """
+        Return Result
+        """
+        return EquityResult(wins, ties, losses, equity_sum, equity_sq_sum)
+
+    """
+    Private Methods
+    """
+    def _enumerate_runouts(self, partial, card_partials, card_masks, num_cards, start_idx=0, runout_mask=0):
+        """
+        Generate (mask of dealt cards, summary) for every way to deal the given number of cards on top of a summarized board
+        """
+        if num_cards == 0:
+            yield (runout_mask, partial)
+            return
+
+        for card_idx in range(start_idx, len(card_partials) - num_cards + 1):
+            extended_partial = HandEvaluator.combine_partials(partial, card_partials[card_idx])
+            yield from self._enumerate_runouts(extended_partial, card_partials, card_masks, num_cards - 1, card_idx + 1, runout_mask | card_masks[card_idx])
+
+    def _record_trial(self, result, hero_strength, opponent_strengths):
+        """
+        Record one outcome: any better opponent hand loses the trial, equal hands split it
+        """
+        best_opponent_strength  = max(opponent_strengths)
+        share                   = 0.0
+        num_winners             = 0
+
+        if hero_strength > best_opponent_strength:
+            share       = 1.0
+            num_winners = 1
+        elif hero_strength == best_opponent_strength:
+            num_winners = 1 + opponent_strengths.count(hero_strength)
+            share       = 1.0 / num_winners
+
+        result.add_trial(share, num_winners)
+
+    def _prepare(self, hole_cards, board, dead_cards, num_opponents):
+        """
+        Get the mask of every card out of the deck (see Card.get_index) and check that enough cards remain to deal each trial
+        """
+        known_cards = set(hole_cards) | set(board) | set(dead_cards)
+        known_mask  = 0
+        num_to_draw = EquityCalculator.BOARD_SIZE - len(board) + EquityCalculator.NUM_HOLE_CARDS * num_opponents
+
+        for card in known_cards:
+            known_mask |= 1 << card.get_index()
+
+        if num_to_draw > Card.NUM_CARDS - len(known_cards):
+            raise Exception(EquityCalculator.EXCEPTION_NOT_ENOUGH_CARDS % num_to_draw)
+
+        """
+        Return Result
+        """
+        return known_mask
+
+    """
+    Table Building Methods
+    """
+    @staticmethod
+    def _build_tables():
+        """
+        Summarize every set of 1 to MAX_SET_SIZE cards in the deck
+        """
+        EquityCalculator._card_sets = dict()
+
+        for set_size in range(1, EquityCalculator.MAX_SET_SIZE + 1):
+            card_sets = list()
+
+            for cards in combinations(Card.DECK, set_size):
+                codes                   = [ card.get_code() for card in cards ]
+                set_product, set_sum, _ = HandEvaluator.get_partial(codes)
+                set_mask                = 0
+
+                for card in cards:
+                    set_mask |= 1 << card.get_index()
+
+                card_sets.append(( set_mask, set_product, set_sum, tuple(codes) ))
+
+            EquityCalculator._card_sets[set_size] = card_sets
+
+"""
+Build lookup tables once at import
+"""
+EquityCalculator._build_tables()
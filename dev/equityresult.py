@@ -0,0 +1,114 @@
+"""
+EquityResult:
+    Tally of how a hand fared against its opponents over a number of trials (sampled or enumerated)
+"""
+
+"""
+Imports
+"""
+from math import sqrt
+
+class EquityResult:
+    """
+    Constants
+    """
+    DEFAULT_Z_SCORE = 1.96  ### Z-score of a 95% confidence interval
+
+    RESULT_STR = "equity %.4f (win %.4f, tie %.4f, loss %.4f) over %d trials"
+
+    """
+    Constructor
+    """
+    def __init__(self, wins=0, ties=0, losses=0, equity_sum=0.0, equity_sq_sum=0.0, exact=False):
+        """
+        Properties
+        """
+        self.wins           = wins          ### Number of trials won outright
+        self.ties           = ties          ### Number of trials tied for the best hand
+        self.losses         = losses        ### Number of trials lost
+        self.equity_sum     = equity_sum    ### Sum of the share of the pot won in each trial
+        self.equity_sq_sum  = equity_sq_sum ### Sum of the squared share of the pot won in each trial
+        self.exact          = exact         ### Was every possible outcome counted (rather than sampled)?
+
+    """
+    String Override
+    """
+    def __str__(self):
+        return EquityResult.RESULT_STR % (self.get_equity(), self.get_win_fraction(), self.get_tie_fraction(), self.get_loss_fraction(), self.get_num_trials())
+
+    """
+    Getter Methods
+    """
+    def get_num_trials(self):
+        return self.wins + self.ties + self.losses
+
+    def get_win_fraction(self):
+        return self._get_fraction(self.wins)
+
+    def get_tie_fraction(self):
+        return self._get_fraction(self.ties)
+
+    def get_loss_fraction(self):
+        return self._get_fraction(self.losses)
+
+    def get_equity(self):
+        """
+        Get the expected share of the pot (ties count as a split share)
+        """
+        return self._get_fraction(self.equity_sum)
+
+    def get_confidence_interval(self, z_score=DEFAULT_Z_SCORE):
+        """
+        Get the (low, high) confidence interval of the equity
+        An exact result has no sampling error
+        """
+        equity          = self.get_equity()
+        num_trials      = self.get_num_trials()
+        margin          = 0.0
+
+        if not self.exact and num_trials > 1:
+            variance    = max( self.equity_sq_sum / num_trials - equity * equity, 0.0 )
+            margin      = z_score * sqrt( variance / num_trials )
+
+        """
+        Return Result
+        """
+        return ( max(equity - margin, 0.0), min(equity + margin, 1.0) )
+
+    """
+    Public Methods
+    """
+    def add_trial(self, share, num_winners):
+        """
+        Record one trial given the share of the pot won and the number of players who split it
+        """
+        if share == 0:
+            self.losses += 1
+        elif num_winners == 1:
+            self.wins += 1
+        else:
+            self.ties += 1
+
+        self.equity_sum     += share
+        self.equity_sq_sum  += share * share
+
+    def merge(self, other):
+        """
+        Add the trials of another result to this one
+        """
+        self.wins           += other.wins
+        self.ties           += other.ties
+        self.losses         += other.losses
+        self.equity_sum     += other.equity_sum
+        self.equity_sq_sum  += other.equity_sq_sum
+        self.exact          = self.exact and other.exact
+
+    """
+    Private Methods
+    """
+    def _get_fraction(self, count):
+        """
+        Get a count as a fraction of the number of trials (0 if there are no trials)
+        """
+        num_trials = self.get_num_trials()
+        return count / num_trials if num_trials > 0 else 0.0
@@ -6,19 +6,28 @@ Game:
 """
 Imports
 """
+from time           import perf_counter
+
+from agentworker    import AgentWorker
 from gamecode       import GameCode
 from gamedata       import GameData
 from gamemove       import GameMove
 from gamesave       import GameSave
 from gamesetup      import GameSetup
 from gametheater    import GameTheater
+from handhistory    import HandHistory
 from gameui         import GameUI
+from humanagent     import HumanAgent
+from pokeragent     import PokerAgent
 
 class Game:
     """
     Constants
     """
     DEFAULT_BLIND_RAISING_SCHEME        = lambda old_blinds, initial_blinds: old_blinds + initial_blinds    ### Default mechanism to increase blinds: add the initial blind to the new blind                                                 
+    DEFAULT_DECISION_TIME_LIMIT         = 5.0                                                               ### Number of seconds a (non-human) agent has to choose each move
+    EQUITY_NUM_SAMPLES                  = 1000                                                              ### Number of trials used to estimate the equity of an agent that uses it
+    EQUITY_TIME_SHARE                   = 0.5                                                               ### Share of an agent's decision time limit that may be spent estimating its equity
     MIN_STARTING_CHIP_COUNT             = 4                                                                 ### Absolute amount of starting chips per player
     NUM_CARDS_FOR_BOARD_TYPE            = [ 3, 1, 1 ]                                                       ### Number of cards to turn on each street
     NUM_HOLE_CARDS                      = 2                                                                 ### Number of hole cards per player
@@ -26,27 +35,57 @@ class Game:
     NUM_PLAYERS_MAX                     = 12                                                                ### Maximum number of players to start the game
     REQUIRED_RAISE_MULTIPLE             = 2                                                                 ### Required raise is this value times the current bet
     SHOW_FOLDED_HANDS                   = True                                                              ### Show the remaining player's hand if folded to that player?
+    SEAT_HUMANS                         = True                                                              ### Is every seat without an agent given to a human at the terminal? (otherwise every seat needs an agent)
+
+    EXCEPTION_EMPTY_SEATS               = "No agent was given for seats %s"
 
     """
     Constructor
     """
-    def __init__(self):
+    def __init__(self, ui=None, decision_time_limit=DEFAULT_DECISION_TIME_LIMIT, clock=None):
         """
         Properties
         """
+        self._agent_worker          = None              ### Runs the decisions of time-limited agents (replaced after a decision runs past the time limit, closed after the game)
         self._blinds_maxed_out      = False             ### Are the blinds at the highest value?
         self._board_name_idx        = 0                 ### List address for the name of the board
-        self._game_data             = GameData()        ### Poker Data Interface Object
+        self._decision_stats        = list()            ### (number of decisions, total time, longest time, number of replaced moves) of each seat
+        self._decision_time_limit   = decision_time_limit   ### Number of seconds a (non-human) agent has to choose each move
+        self._game_data             = GameData(clock=clock) ### Poker Data Interface Object (the blind timer follows the given clock, the wall clock by default)
         self._game_play_code        = GameCode.NEW_GAME ### What kind of game are we playing or playing back (new/load)?
         self._game_save             = None              ### Object that manages saving a game finished or in progress
         self._game_theater          = None              ### Plays back a finished game
         self._hand_actions          = list()            ### List of actions that were made in a hand
-        self._ui                    = GameUI()          ### User Interface Object
+        self._hand_history          = None              ### Save file the game theater reads hands from (closed after playback)
+        self._late_workers          = dict()            ### Maps seat numbers to the retired worker still running the seat agent's decision that ran out of time
+        self._ui                    = ui if ui is not None else GameUI()    ### User Interface Object (any object with the same methods as GameUI)
         self._num_remaining_players = 0                 ### Number of remaining players in the game
+        self._seat_agents           = list()            ### Agent that chooses the moves of each seat (a human at the terminal if not given)
+        self._seats                 = dict()            ### Maps player IDs to seat numbers
+
+    """
+    Getter Methods
+    """
+    def get_seat(self, player):
+        return self._seats[player.ID]
+
+    def get_decision_stats(self):
+        """
+        Get the (number of decisions, total decision time, longest decision time, number of replaced moves) of each seat
+        A move is replaced by a check or fold if it took too long to choose or was not legal
+        """
+        return list(self._decision_stats)
 
     """
     Public methods
     """
+    def seat_agents(self, agents):
+        """
+        Choose the agent of each seat (seats are numbered in the order the players joined the game)
+        A seat without an agent (None) is played by a human at the terminal
+        """
+        self._seat_agents = list(agents)
+
     def setup(self):
         """
         Set up the game structure with user-entered or loaded values
@@ -78,13 +117,21 @@ class Game:
             """
             Play back a game
             """
-            self._game_theater.playback_game()
+            try:
+                self._game_theater.playback_game()
+            finally:
+                if self._hand_history is not None:
+                    self._hand_history.close()
+                    self._hand_history = None
             
         elif self._game_play_code != GameCode.NO_PLAY:
             """
             Play a game (new or loaded)
             """
-            self._start_new_or_loaded_game()
+            try:
+                self._start_new_or_loaded_game()
+            finally:
+                self._close_agent_worker()
 
     """
     Callback Methods
@@ -111,9 +158,10 @@ class Game:
         """
         Start Game
 
-        Activate hot key listeners
+        Activate hot key listeners and seat the players
         """
         self._ui.listen_for_hot_keys()
+        self._assign_seats()
 
         """
         Initialize the round number if this is a new game
@@ -318,11 +366,18 @@ class Game:
         If this is a game in progress, prompt user to continue or overwrite
         If this is a complete game, prompt user for playback
 
-        Load the existing game data to see if it is a finished or in-progress game
+        Read the summary of the existing game to see if it is a finished or in-progress game
+        Only load the whole game if the save file has no up-to-date summary
         """
-        self._game_save.load()
-        
-        if self._game_save.is_game_complete():
+        save_summary = self._game_save.read_summary()
+
+        if save_summary is None:
+            self._game_save.load()
+            is_game_complete = self._game_save.is_game_complete()
+        else:
+            is_game_complete = save_summary.is_game_complete()
+
+        if is_game_complete:
 
             """
             Loaded game is already finished
@@ -337,13 +392,13 @@ class Game:
             if load_game_history:
                 """
                 Get the saved game data
+                Read hands straight from the save file (decoding each one as it is played back) if it holds every hand
                 """
-                loaded_game = self._game_save.get_game_save()
-
-                """
-                Parse the saved game data
-                """
-                game_setup, game_hands = loaded_game
+                if save_summary is not None or self._game_save.is_saved():
+                    self._hand_history      = HandHistory(self._game_save.get_game_save_name())
+                    game_setup, game_hands  = self._hand_history.get_setup(), self._hand_history
+                else:
+                    game_setup, game_hands  = self._game_save.get_game_save()
 
                 """
                 Create a game theater and set the play protocol to playback
@@ -367,8 +422,11 @@ class Game:
 
             if load_existing_game:
                 """
-                Get the loaded game data
+                Get the loaded game data (loading the save file now if only its summary was read)
                 """
+                if save_summary is not None:
+                    self._game_save.load()
+
                 loaded_game = self._game_save.get_game_save()
 
                 """
@@ -402,6 +460,7 @@ class Game:
                 """
                 game_setup.init_timestamp           = timestamp_final
                 game_setup.round_number             = round_number
+                game_setup.hand_number              = len(game_hands)
                 game_setup.init_player_state        = player_state_final
                 game_setup.handle_time_expired      = self._handle_time_expired
                 game_setup.blind_increase_scheme    = Game.DEFAULT_BLIND_RAISING_SCHEME
@@ -634,15 +693,18 @@ class Game:
                 if preflop is False:
                     self._ui.display_board(self._game_data.get_board(), board_name_idx=self._board_name_idx)
 
-                chosen_move, chosen_amount = self._ui.prompt_available_moves(player, available_moves, action_to_play)
+                chosen_move, chosen_amount = self._choose_move(current_player_idx, player, available_moves, action_to_play, preflop=preflop)
                 adjusted_amount = self._game_data.play_move(current_player_idx, chosen_move, chosen_amount)
                 self._ui.display_move_made(player, chosen_move, adjusted_amount)
 
                 """
-                Store the action for the save snapshot
+                Store the action for the save snapshot and show it to every agent
                 """
                 self._hand_actions.append((player.ID, chosen_move, adjusted_amount))
 
+                for agent in self._seat_agents:
+                    agent.observe(player.ID, chosen_move, adjusted_amount)
+
             else:
                 """
                 Player has no available moves: Skip player and move on
@@ -656,6 +718,125 @@ class Game:
             current_player_idx  = self._game_data.get_next_player_pos(current_player_idx)
             round_over          = self._game_data.is_round_over()
 
+    def _assign_seats(self):
+        """
+        Number the seats in the order the players joined the game (the order of their IDs)
+        and fill every seat without an agent with a human at the terminal (if this game seats humans)
+        Decision statistics are kept for each seat
+        """
+        player_ids  = sorted([ player.ID for player in self._game_data.get_players() ])
+        self._seats = { player_id : seat for seat, player_id in enumerate(player_ids) }
+
+        self._seat_agents       += [ None ] * ( len(player_ids) - len(self._seat_agents) )
+        empty_seats             = [ seat for seat, agent in enumerate(self._seat_agents) if agent is None ]
+
+        if len(empty_seats) > 0 and not self.SEAT_HUMANS:
+            raise Exception(Game.EXCEPTION_EMPTY_SEATS % empty_seats)
+
+        self._seat_agents       = [ agent if agent is not None else HumanAgent(self._ui) for agent in self._seat_agents ]
+        self._decision_stats    = [ ( 0, 0.0, 0.0, 0 ) for _ in self._seat_agents ]
+
+    def _choose_move(self, player_idx, player, available_moves, action_to_play, preflop=False):
+        """
+        Ask the agent at the player's seat for a move (see _ask_agent)
+        A move that was not chosen in time or is not legal is replaced by a check or fold
+        """
+        seat            = self._seats[player.ID]
+        agent           = self._seat_agents[seat]
+        time_limit      = self._decision_time_limit if agent.TIME_LIMITED else None
+        agent_move      = None
+        decision_time   = 0.0
+
+        """
+        An agent still running a decision that ran out of time is not asked for another one (agents do not need to be thread-safe):
+        its seat checks or folds until that decision returns
+        """
+        if seat in self._late_workers and self._late_workers[seat].is_finished():
+            del self._late_workers[seat]
+
+        if seat not in self._late_workers:
+            agent_move, decision_time = self._ask_agent(player_idx, agent, time_limit, available_moves, action_to_play, preflop)
+
+            if self._agent_worker is not None and self._agent_worker.is_retired():
+                self._late_workers[seat]    = self._agent_worker
+                self._agent_worker          = None
+
+        timed_out = agent_move is None
+
+        if timed_out:
+            agent_move = PokerAgent.get_passive_move(available_moves)
+
+        chosen_move, chosen_amount = agent_move
+
+        """
+        A bet or raise without an amount is made for the required amount
+        """
+        if chosen_move in { GameMove.BET, GameMove.RAISE } and chosen_amount is None:
+            chosen_amount = action_to_play
+
+        illegal_move    = chosen_move not in available_moves or ( chosen_move in { GameMove.BET, GameMove.RAISE } and chosen_amount < action_to_play )
+
+        if timed_out or illegal_move:
+            chosen_move, chosen_amount = PokerAgent.get_passive_move(available_moves)
+
+        """
+        Update the seat's decision statistics
+        """
+        num_decisions, total_time, longest_time, num_replaced = self._decision_stats[seat]
+
+        self._decision_stats[seat] = (
+            num_decisions + 1,
+            total_time + decision_time,
+            max(longest_time, decision_time),
+            num_replaced + int(timed_out or illegal_move)
+        )
+
+        """
+        Return Result
+        """
+        return (chosen_move, chosen_amount)
+
+    def _ask_agent(self, player_idx, agent, time_limit, available_moves, action_to_play, preflop=False):
+        """
+        Ask an agent for a move, giving it an immutable view of the table
+        A time-limited agent decides on the agent worker thread and the game stops waiting once the time limit has passed
+        Return the chosen move (None if it was not chosen in time) and the time the agent took to decide
+        """
+        equity = None
+
+        if agent.USES_EQUITY:
+            """
+            Calculate the player's equity against the players still in the hand for the view
+            It is exact wherever enumerating the spot is cheap (heads-up on the turn or river) and sampled everywhere else
+            """
+            equity_budget   = time_limit * Game.EQUITY_TIME_SHARE if time_limit is not None else None
+            equity          = self._game_data.calculate_equity(player_idx, num_samples=Game.EQUITY_NUM_SAMPLES, time_budget=equity_budget, exact=True).get_equity()
+
+        view = self._game_data.get_game_view(player_idx, preflop=preflop, time_budget=time_limit, equity=equity)
+
+        start_time = perf_counter()
+
+        if time_limit is None:
+            agent_move = agent.choose_move(view, available_moves, action_to_play)
+        else:
+            if self._agent_worker is None:
+                self._agent_worker = AgentWorker()
+
+            agent_move = self._agent_worker.choose_move(agent, view, available_moves, action_to_play, time_limit)
+
+        """
+        Return Result
+        """
+        return (agent_move, perf_counter() - start_time)
+
+    def _close_agent_worker(self):
+        """
+        Let the agent worker thread end once the game is over (a new worker is started if the game is played again)
+        """
+        if self._agent_worker is not None:
+            self._agent_worker.close()
+            self._agent_worker = None
+
     def _open_for_betting(self, preflop=False):
         """
         Display the current pot
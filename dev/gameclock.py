@@ -0,0 +1,30 @@
+"""
+GameClock:
+    Source of time for the game timer
+    This clock follows the wall clock and runs each scheduled callback on a timer thread (see VirtualClock for simulations)
+"""
+
+"""
+Imports
+"""
+from threading  import Timer
+from time       import time
+
+class GameClock:
+    """
+    Public Methods
+    """
+    def get_time(self):
+        """
+        Get the current time in seconds
+        """
+        return time()
+
+    def call_later(self, delay, callback):
+        """
+        Call the callback function once the given number of seconds have passed
+        The timer thread is a daemon thread so that it will terminate immediately if the game is over
+        """
+        timer           = Timer(delay, callback)
+        timer.daemon    = True
+        timer.start()
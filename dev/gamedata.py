@@ -6,16 +6,15 @@ GameData:
 """
 Imports
 """
-from copy       import deepcopy
-from itertools  import combinations
-from random     import randint
-
-from deck       import Deck
-from hand       import Hand
-from gamemove   import GameMove
-from gamesetup  import GameSetup
-from gametimer  import GameTimer
-from player     import Player
+from deck               import Deck
+from equitycalculator   import EquityCalculator
+from hand               import Hand
+from gamemove           import GameMove
+from gamerandom         import GameRandom
+from gamesetup          import GameSetup
+from gametimer          import GameTimer
+from gameview           import GameView
+from tablestate         import TableState
 
 class GameData:
     """
@@ -30,28 +29,39 @@ class GameData:
     """
     Constructor
     """
-    def __init__(self):
+    def __init__(self, clock=None):
         """
         Properties
 
         Game setup properies
         """
         self._big_blind_amt             = 0                     ### Current big blind size
+        self._clock                     = clock                 ### Source of time for the game timer (None for the wall clock)
         self._deck                      = None                  ### Deck of cards for the game
+        self._equity_calculator         = None                  ### Estimates hand equity for players deciding on a move (created on first use)
         self._game_setup                = None                  ### Holds setup data for the game
         self._game_timer                = None                  ### Game timer to track the interval of increasing the big blind
-        self._players                   = None                  ### List of players in the game (to be initialized later)
+        self._rng                       = None                  ### Game's random number generator (seeded from the game setup)
+        self._table                     = None                  ### Seat-indexed state of every player in the game, with the dealer as a seat offset (to be initialized later)
 
         """
         Current hand properies
         """
         self._aggressor_pos             = 0                     ### Position of the player with the highest bet on the table
         self._board                     = list()                ### List of community cards
-        self._hand_players_played_move  = None                  ### Tracks if a player has made a move in the current betting round
         self._pot                       = GameData.INITIAL_POT  ### List of sizes of all pots (main and side)
-        self._pot_contenders            = list()                ### Corrsponding list containing all players contending for each pot
+        self._pot_eligibility           = list()                ### Corresponding list of bitmasks of the seats contending for each pot
         self._prev_action_folded        = False                 ### Was the last action a fold?
 
+        """
+        Betting state of the newest pot (kept up to date by every move so queries take constant time)
+        """
+        self._max_action                = 0                     ### Size of the highest bet in play
+        self._num_in_hand               = 0                     ### Number of players still contending for the pot
+        self._num_available_betters     = 0                     ### Number of contending players who have chips left to bet
+        self._num_sufficient            = 0                     ### Number of contending players whose action matches the highest bet (or who are all-in)
+        self._num_to_move               = 0                     ### Number of players who have not had a turn in the current betting round
+
     """
     Getter Methods
     """
@@ -71,7 +81,7 @@ class GameData:
         """
         Determine the small blind position: Dealer if the game is heads-up, player after dealer otherwise
         """
-        if len(self._players) == GameData.HEADS_UP_PLAYER_COUNT:
+        if self._table.get_num_seats() == GameData.HEADS_UP_PLAYER_COUNT:
             small_blind = GameData.DEALER_IDX
         else:
             small_blind = self.get_next_player_pos(GameData.DEALER_IDX, only_in_hand=False)
@@ -97,7 +107,7 @@ class GameData:
         """
         Include small blind only if this is not a heads-up game
         """
-        if len(self._players) == GameData.HEADS_UP_PLAYER_COUNT:
+        if self._table.get_num_seats() == GameData.HEADS_UP_PLAYER_COUNT:
             positions = ( dealer_pos, big_blind_pos )
         else:
             positions = ( dealer_pos, small_blind_pos, big_blind_pos )
@@ -109,61 +119,45 @@ class GameData:
 
     def get_players(self):
         """
-        Get a copy of every player as a list
+        Get an immutable view of every player as a list (in order of position, starting with the dealer)
         """
-        return deepcopy(self._players)
+        return [ self._table.get_player_view(seat) for seat in self._table.get_seats() ]
 
     def get_hand_player(self, pot_idx=-1, player_idx=-1):
         """
-        Get a copy of a player at a specificed index
+        Get an immutable view of a player at a specificed position
+        If the position was not specified (or that player is not contending for the pot), get the first contending player
         """
-        player = deepcopy(self._pot_contenders[pot_idx][player_idx]) if player_idx != -1 else None
+        seat = self._table.get_seat(player_idx) if player_idx != -1 else None
 
-        if player is None:
-            """
-            If the index was not specified, get the first non-None player
-            """
-            for contender in self._pot_contenders[pot_idx]:
+        if seat is None or not self._is_contender(seat, pot_idx=pot_idx):
 
-                if contender is not None:
-                    player = contender
-                    break
+            contender_seats = self._get_contender_seats(pot_idx=pot_idx)
+            seat            = min(contender_seats, key=self._table.get_position) if len(contender_seats) > 0 else None
 
         """
         Return Result
         """
-        return player
+        return self._table.get_player_view(seat) if seat is not None else None
 
     def get_num_players_in_hand(self):
         """
         Get the number of remaining players in the hand
         """
-        remaining_players = list()
-
-        """
-        Remove folded players
-        """
-        for contender in self._pot_contenders[-1]:
-            
-            if contender is not None:
-                remaining_players.append(contender)
-
-        """
-        Return Result
-        """
-        return len(remaining_players)
+        return self._num_in_hand
 
     def get_num_players_all_in(self):
         """
         Get the number of players in the hand who are all-in
         """
-        return len([ player for player in self._pot_contenders[-1] if player is not None and player.get_stack_size() == 0 ])
+        return self._num_in_hand - self._num_available_betters
 
     def get_pot(self):
         """
         Create a pot list buffer
         """
-        pots = list()
+        pots    = list()
+        actions = self._table.get_column(TableState.ACTION)
 
         """
         For every pot (main and side) add up the total current action with the value of center chips
@@ -171,7 +165,7 @@ class GameData:
         """
         for i in range(len(self._pot)):
             center_pot      = self._pot[i]
-            total_action    = sum([ player.get_action() for player in self._pot_contenders[i] if player is not None ])
+            total_action    = sum([ actions[seat] for seat in self._get_contender_seats(pot_idx=i) ])
             pots.append(center_pot + total_action)
 
         """
@@ -187,29 +181,28 @@ class GameData:
 
     def get_board(self):
         """
-        Get a copy of the community cards
+        Get a copy of the community cards list (cards are immutable and shared)
         """
-        return deepcopy(self._board)
+        return list(self._board)
 
     def get_next_player_pos(self, pos, only_in_hand=True):
         """
         Get the position of the player located to the left of the given player position
-        Since the table is circular, moving out of bounds goes to the other side of the list
+        Since the table is circular, moving out of bounds goes to the other side of the table
         parameter only_in_hand: Do we count all players or just those who are still in the hand?
 
         Local Variables
         """
-        players         = self._pot_contenders[-1] if only_in_hand else self._players
-        num_players     = len(players)
+        num_players     = self._table.get_num_seats()
         offset          = GameData.LEFT_POS_OF_PLAYER
         next_player_pos = ( pos + offset ) % num_players
 
         """
         Rotate to the next non-folded player
         """
-        while players[ next_player_pos ] is None:
+        while only_in_hand and not self._is_contender(self._table.get_seat(next_player_pos)):
             offset          += GameData.LEFT_POS_OF_PLAYER
-            next_player_pos = ( pos + offset ) % len(players)
+            next_player_pos = ( pos + offset ) % num_players
 
         """
         Return Result
@@ -220,8 +213,7 @@ class GameData:
         """
         Get the size of the maximum bet that is currently in play
         """
-        player_actions = [ player.get_action() for player in self._pot_contenders[-1] if player is not None ]
-        return max(player_actions)
+        return self._max_action
 
     def get_big_blind_amt(self):
         """
@@ -229,16 +221,64 @@ class GameData:
         """
         return self._big_blind_amt
 
+    def get_ante_amt(self):
+        """
+        Get the current size of the ante (paid by every player before each hand)
+        """
+        return self._game_setup.get_blind_schedule().get_ante(self._game_setup.round_number)
+
     def get_winner(self):
         """
-        Get a copy of the winning player if there is one (i.e. only 1 player left in the game)
+        Get an immutable view of the winning player if there is one (i.e. only 1 player left in the game)
         """
         winner = None
 
-        if len(self._players) == 1:
-            winner = self._players[0]
+        if self._table.get_num_seats() == 1:
+            winner = self._table.get_player_view(0)
+
+        return winner
+
+    def get_game_view(self, player_idx, preflop=False, time_budget=None, equity=None):
+        """
+        Get an immutable view of the table for the player at the given hand position
+        Only that player's hole cards are visible
+        """
+        seats = self._table.get_seats()
+
+        return GameView(
+            player_idx,
+            tuple([ self._table.get_player_view(seat, show_hole_cards=player_pos == player_idx) for player_pos, seat in enumerate(seats) ]),
+            tuple([ self._is_contender(seat) for seat in seats ]),
+            tuple(self._board),
+            tuple(self.get_pot()),
+            self.get_max_action(),
+            self._big_blind_amt,
+            self._game_setup.round_number,
+            preflop,
+            time_budget,
+            equity
+        )
+
+    def calculate_equity(self, player_idx, num_samples=None, time_budget=None, exact=False):
+        """
+        Calculate the equity of the player at the given hand position against every other player still in the hand
+        Only the player's own hole cards and the board are treated as known
+        An exact calculation enumerates every runout and every opponent holding, so it is only used heads-up on the turn or river
+        (see EquityCalculator.is_exact_cheap; otherwise the equity is estimated by sampling within the given budgets)
+        """
+        hole_cards      = self._table.get_hole_cards( self._table.get_seat(player_idx) )
+        num_opponents   = self.get_num_players_in_hand() - 1
 
-        return deepcopy(winner)
+        if self._equity_calculator is None:
+            self._equity_calculator = EquityCalculator(rng=GameRandom.create(GameRandom.draw_seed(self._rng), self._game_setup.rng_kind))
+
+        """
+        Return Result
+        """
+        if exact and num_opponents == 1 and EquityCalculator.is_exact_cheap(self._board):
+            return self._equity_calculator.calculate_exact(hole_cards, board=self._board)
+
+        return self._equity_calculator.calculate(hole_cards, board=self._board, num_opponents=num_opponents, num_samples=num_samples, time_budget=time_budget)
 
     """
     Game Setup Methods
@@ -250,15 +290,17 @@ class GameData:
         self._game_setup = game_setup
 
         """
-        Set the current big blind to the initial big blind
+        Seed the game's random number generator, choosing (and recording) a seed if there is none yet
         """
-        self._big_blind_amt = self._game_setup.starting_big_blind
+        if self._game_setup.seed is None:
+            self._game_setup.seed = GameRandom.new_seed()
+
+        self._rng = GameRandom.create(self._game_setup.seed, self._game_setup.rng_kind)
 
         """
-        Raise the blinds for every passed round number (to catch up on the blind schedule)
+        Look up the big blind of the current round (this catches up on the blind schedule of a loaded game)
         """
-        for _ in range(GameData.INITIAL_ROUND_NUMBER, self._game_setup.round_number):
-            self.raise_blinds()
+        self.raise_blinds()
 
         """
         Create a game timer instance to call the blind increase method at the interval time
@@ -268,7 +310,8 @@ class GameData:
         self._game_timer = GameTimer(
             self._game_setup.blind_increase_interval,
             self._game_setup.handle_time_expired, 
-            init_start_time=self._game_setup.init_timestamp
+            init_start_time=self._game_setup.init_timestamp,
+            clock=self._clock
         )
 
         """
@@ -279,66 +322,73 @@ class GameData:
 
     def setup_players(self, loaded_players=list()):
         """
-        Create each player and give each player a starting stack
+        Seat each player and give each player a starting stack
         """
 
         if len(loaded_players) == 0:
 
-            self._players = [ Player() for _ in range(self._game_setup.starting_num_players) ]
+            self._table = TableState(self._game_setup.starting_num_players)
 
-            for player in self._players:
-                player.collect_chips(self._game_setup.starting_chip_count)
+            for seat in range(self._game_setup.starting_num_players):
+                self._table.seat_player(seat, self._game_setup.starting_chip_count)
 
-            first_dealer = randint(0, self._game_setup.starting_num_players - 1)
+            first_dealer = self._rng.randint(0, self._game_setup.starting_num_players - 1)
 
         else:
 
-            self._players = loaded_players
+            """
+            Reseat each loaded player from its saved view (it keeps its ID and stack but no cards or action)
+            The players were saved in order of position, so the dealer of the saved hand is in the first seat
+            """
+            self._table = TableState(len(loaded_players))
 
-            for player in self._players:
-                player.pass_hole_cards()
+            for seat, loaded_player in enumerate(loaded_players):
+                self._table.seat_player(seat, loaded_player.get_stack_size(), player_id=loaded_player.ID)
 
             first_dealer = 1
 
         """
-        Randomly decide who is the first dealer and order the players to set dealer to first position
+        Randomly decide who is the first dealer (a loaded game moves the button on from the saved hand)
         """
-        self._order_players(first_dealer)
+        self._table.set_dealer_seat(first_dealer)
 
     """
     Create a deck of cards and shuffle them
     """
     def setup_cards(self, loaded_players=False):
-        self._deck = Deck()
-        self._deck.shuffle()
+        self._deck = Deck(rng=GameRandom.create(kind=self._game_setup.rng_kind))
+        self._shuffle_deck()
 
     """
     Hand Setup Methods
     """
     def setup_hand_players(self):
         """
-        Add each player to a player buffer that manages the current hand
-        Also create a list that tracks if each player has played in the current betting round at least once
+        Make every seat contend for the main pot
+        Also mark that no player has played in the current betting round yet
         """
-        self._pot_contenders.clear()
-        self._pot_contenders.append( self._players[:] )
-        self._hand_players_played_move  = [ False ] * self.get_num_players_in_hand()
+        self._pot_eligibility.clear()
+        self._pot_eligibility.append( ( 1 << self._table.get_num_seats() ) - 1 )
+
+        for seat in range(self._table.get_num_seats()):
+            self._table.set_moved(seat, False)
+
+        self._count_betting_state()
 
     def setup_pot(self):
-        self._pot = deepcopy( GameData.INITIAL_POT )
+        self._pot = list( GameData.INITIAL_POT )
 
     def raise_blinds(self):
         """
-        Use the established blind raising scheme to raise the blinds
+        Raise the blinds to the scheduled level of the current round
         """
-        self._big_blind_amt = self._game_setup.blind_increase_scheme(self._big_blind_amt, self._game_setup.starting_big_blind)
+        self._big_blind_amt = self._game_setup.get_blind_schedule().get_big_blind(self._game_setup.round_number)
 
     def blinds_maxed_out(self):
         """
-        Determine if the current big blind should not be raised any higher
-        This is done by checking if the big blind meets or exceeds half of the value of every single chip in the game
+        Determine if the current big blind should not be raised any higher (the current round is at the final blind level)
         """
-        return self._big_blind_amt >= ( self._game_setup.starting_chip_count * self._game_setup.starting_num_players ) / 2
+        return self._game_setup.get_blind_schedule().is_final_level(self._game_setup.round_number)
 
     def start_timer(self):
         """
@@ -351,23 +401,39 @@ class GameData:
         Pass cards to each player
         """
         for _ in range(num_hole_cards):
-            for player in self._players:
+            for seat in self._table.get_seats():
                 card = self._deck.draw_card()
-                player.take_hole_card(card)
+                self._table.take_hole_card(seat, card)
 
     def make_blind_bets(self):
         """
         Find the small and big blind players
         """
         small_idx, big_idx  = self.get_blind_positions() 
-        small_blind         = self._players[small_idx]
-        big_blind           = self._players[big_idx]
-        
+        small_blind_seat    = self._table.get_seat(small_idx)
+        big_blind_seat      = self._table.get_seat(big_idx)
+        num_seats           = self._table.get_num_seats()
+
+        """
+        Have every player bet the ante and move it to the pot right away (it is dead money: it does not count toward
+        the bets of the first betting round), so a player who cannot cover the ante is only eligible for the part of the pot they matched
+        No one antes more than the second largest stack: a part of the ante no other player could match would make a pot only its owner can win
+        """
+        ante = min(self.get_ante_amt(), sorted([ self._table.get_stack_size(seat) for seat in range(num_seats) ])[-2])
+
+        if ante > 0:
+
+            for seat in range(num_seats):
+                self._table.bet(seat, ante)
+
+            self.move_action_to_pot()
+
         """
         Have the small blind and big blind bet blinds
         """
-        small_blind.bet(self._big_blind_amt / 2)
-        big_blind.bet(self._big_blind_amt)
+        self._table.bet(small_blind_seat, self._big_blind_amt / 2)
+        self._table.bet(big_blind_seat, self._big_blind_amt)
+        self._count_betting_state()
 
         """
         Update the maximum action to the big blind and set the current agressor to the big blind
@@ -390,61 +456,74 @@ class GameData:
         """
         Find the number of players who are able to bet chips (stack size is not empty)
         """
-        return len([ player for player in self._pot_contenders[-1] if player is not None and player.get_stack_size() > 0 ])
+        return self._num_available_betters
 
     def move_action_to_pot(self):
         """
         Add all player's action (chips bet) to the pot and reset all player action
         ALWAYS select the last pot in the list: new chips ALWAYS go to the newest side
         pot if there are any
+
+        The contenders' actions are sorted once and every distinct action size (bet level) is
+        handled in a single pass: each level fills the newest pot with the chips bet up to it
+        by each contender still eligible, and a new side pot is created for the next level
+        without the players who went all-in at this one
+
+        Local Variables
         """
-        initial_pot_idx         = len(self._pot) - 1
-        remaining_action_exists = True
+        initial_pot_idx = len(self._pot) - 1
+        eligibility     = self._pot_eligibility[-1]
+        contenders      = sorted([ ( self._table.get_action(seat), seat ) for seat in self._get_contender_seats() ])
+        num_contenders  = len(contenders)
+        prev_level      = 0
 
-        while remaining_action_exists:
-            """
-            Get the minimum action in play
-            """
-            min_action = min( [ player.get_action() for player in self._pot_contenders[-1] if player is not None ] )
+        for contender_num in range(num_contenders):
 
-            """
-            Take the minimum action from each player and add to the current pot
-            """
-            for player in self._pot_contenders[-1]:
+            level, seat = contenders[contender_num]
 
-                if player is not None:
-                    self._pot[-1] += player.release_action(amount=min_action)
+            if level > prev_level:
+                """
+                Every contender from this one on bet at least this level
+                Create a side pot for this level if the previous level filled the newest pot
+                """
+                if contender_num > 0:
+                    self._pot.append(0)
+                    self._pot_eligibility.append(eligibility)
 
-            """
-            Check if any player has any remaining action
-            """
-            remaining_action_exists = any([ player.get_action() > 0 for player in self._pot_contenders[-1] if player is not None ])
+                self._pot[-1]   += ( level - prev_level ) * ( num_contenders - contender_num )
+                prev_level      = level
 
             """
-            Create a side pot if any remaining action exists
+            A player who is all-in at this level is not eligible for any pot above it
             """
-            if remaining_action_exists:
-                self._create_side_pot()
+            if self._table.get_stack_size(seat) == 0:
+                eligibility &= ~( 1 << seat )
 
         """
-        Create an additional side pot if any of the remaining pot contenders is all in
+        Take the action from each contender now that it has been split between the pots
         """
-        any_player_all_in           = any( [ player.get_stack_size() == 0 for player in self._pot_contenders[-1] if player is not None ] )
-        multiple_available_betters  = self.get_num_available_betters() > 1
+        for _, seat in contenders:
+            self._table.release_action(seat)
 
-        if any_player_all_in and multiple_available_betters:
-            self._create_side_pot()
+        """
+        Create an additional side pot if any of the remaining pot contenders is all in
+        (and there are still multiple players who are able to bet)
+        """
+        if eligibility != self._pot_eligibility[-1] and bin(eligibility).count("1") > 1:
+            self._pot.append(0)
+            self._pot_eligibility.append(eligibility)
 
         """
         Add action of folded players to the initial pot (pot before side pots were created)
         """
-        for player in self._players:
-            self._pot[initial_pot_idx] += player.release_action()
+        for seat in range(self._table.get_num_seats()):
+            self._pot[initial_pot_idx] += self._table.release_action(seat)
         
         """
-        Reset the last aggressor to no one
+        Reset the last aggressor to no one and recount the betting state (all action is now in the pots)
         """
         self._aggressor_pos = None
+        self._count_betting_state()
 
     def flip_board_cards(self, num_board_cards):
         """
@@ -462,9 +541,9 @@ class GameData:
             board_cards.append(board_card)
 
         """
-        Return a copy the board cards
+        Return the board cards (cards are immutable, so they do not need to be copied)
         """
-        return deepcopy(board_cards)
+        return board_cards
 
     def evaluate_hands(self, pot_idx):
         player_hand_triple_list = list()
@@ -472,37 +551,33 @@ class GameData:
         """
         Create a triple for each player in the hand:
             * First value is the player's position (relative to the dealer)
-            * Second value is a copy of the player instance
+            * Second value is an immutable view of the player
             * Third value is the best possible hand that can be made with the player's hole cards and the board
         """
-        for player_idx in range(len(self._pot_contenders[-1])):
+        for seat in sorted(self._get_contender_seats(pot_idx=pot_idx), key=self._table.get_position):
             """
-            Find all combinations of hole and board cards and find the one with the maximum value
+            Evaluate the best hand that can be made from the hole and board cards in one pass
             """
-            player = self._pot_contenders[pot_idx][player_idx]
-
-            if player is not None:
-                hole_cards          = player.get_hole_cards()
-                hand_cards          = hole_cards + self._board
-                hand_combinations   = combinations(hand_cards, Hand.HAND_SIZE)
-                optimal_hand        = max( [ Hand(hand_cards) for hand_cards in hand_combinations ] )
+            hole_cards          = self._table.get_hole_cards(seat)
+            optimal_hand        = Hand.get_best_hand(hole_cards + self._board)
 
-                """
-                Create the triple and add it to the list
-                """
-                player_hand_triple_list.append( ( player_idx, deepcopy(player), optimal_hand ) )
+            """
+            Create the triple and add it to the list
+            """
+            player_hand_triple_list.append( ( self._table.get_position(seat), self._table.get_player_view(seat), optimal_hand ) )
 
         """
-        Sort the position-player-hand triples by the value of the hand (best hand at the beginning of the list)
+        Sort the position-player-hand triples by the rank key of the hand (best hand at the beginning of the list)
         """
         PLAYER_HAND = 2
-        player_hand_triple_list.sort(key=lambda player_trip: player_trip[PLAYER_HAND], reverse=True)
+        player_hand_triple_list.sort(key=lambda player_trip: player_trip[PLAYER_HAND].rank_key, reverse=True)
 
         """
         Determine the positions of every player with the best hand
         """
         winner_positions            = list()
         winner_pos, _, best_hand    = player_hand_triple_list[0]
+        best_rank_key               = best_hand.rank_key
 
         winner_positions.append(winner_pos)
 
@@ -510,7 +585,7 @@ class GameData:
 
             hand_pos, _, hand = player_hand_triple_list[i]
 
-            if hand == best_hand:
+            if hand.rank_key == best_rank_key:
                 winner_positions.append(hand_pos)
             else:
                 break
@@ -529,11 +604,11 @@ class GameData:
             """
             If no position list was given, pass the pot to all remaining players (contenders)
             """
-            remaining_players   = [ player for player in self._pot_contenders[pot_idx] if player is not None ]
-            split               = len(remaining_players)
+            remaining_seats     = self._get_contender_seats(pot_idx=pot_idx)
+            split               = len(remaining_seats)
             
-            for player in remaining_players:
-                player.collect_chips( self._pot[pot_idx] / split )
+            for seat in remaining_seats:
+                self._table.collect_chips( seat, self._pot[pot_idx] / split )
 
         else:
             """
@@ -542,7 +617,9 @@ class GameData:
             split = len(player_pos_list)
 
             for player_idx in player_pos_list:
-                self._pot_contenders[pot_idx][player_idx].collect_chips( self._pot[pot_idx] / split )
+                self._table.collect_chips( self._table.get_seat(player_idx), self._pot[pot_idx] / split )
+
+        self._count_betting_state()
     
     def add_board_cards(self, board_cards):
         """
@@ -557,32 +634,33 @@ class GameData:
         """
         Indicate that no players have played a turn yet
         """
-        num_contenders                  = len(self._pot_contenders[-1])
-        self._hand_players_played_move  = [ False ] * num_contenders
-
         """
         Assume all folded players have played (in order to be skipped)
         """
-        for contender_idx in range(num_contenders):
+        self._num_to_move = 0
 
-            contender = self._pot_contenders[-1][contender_idx]
+        for seat in range(self._table.get_num_seats()):
+            is_contender        = self._is_contender(seat)
+            self._num_to_move   += is_contender
 
-            if contender is None:
-                self._hand_players_played_move[contender_idx] = True
+            self._table.set_moved(seat, not is_contender)
 
     def play_move(self, player_idx, move, amount):
         """
         Local Variables
         """
-        player      = self._pot_contenders[-1][player_idx]
-        stack       = player.get_stack_size()
-        max_action  = self.get_max_action()
+        seat            = self._table.get_seat(player_idx)
+        stack           = self._table.get_stack_size(seat)
+        max_action      = self.get_max_action()
+        prev_action     = self._table.get_action(seat)
+        was_sufficient  = self._is_action_sufficient(seat)
+        had_moved       = self._table.has_moved(seat)
 
         if move == GameMove.CHECK:
             """
             CHECK: do nothing but mark that the player has had a turn during this round
             """
-            self._hand_players_played_move[player_idx] = True
+            self._table.set_moved(seat)
 
         elif move == GameMove.BET:
             """
@@ -591,7 +669,7 @@ class GameData:
             if amount > stack:
                 amount = stack
 
-            player.bet(amount)
+            self._table.bet(seat, amount)
 
             """
             A bet sets the maximum action to the bet size (player's new action) and sets this player to the current aggressor
@@ -601,13 +679,13 @@ class GameData:
             """
             Indicate that the player has had a turn during this betting round
             """
-            self._hand_players_played_move[player_idx] = True
+            self._table.set_moved(seat)
 
         elif move == GameMove.CALL:
             """
             CALL: Player bets to match player's action to the current highest bet
             """
-            player_action   = player.get_action()
+            player_action   = self._table.get_action(seat)
             amount_to_call  = max_action - player_action
 
             """
@@ -619,18 +697,18 @@ class GameData:
             """
             Bet the required amount to call
             """
-            player.bet(amount_to_call)
+            self._table.bet(seat, amount_to_call)
 
             """
             Indicate that the player has had a turn during this betting round
             """
-            self._hand_players_played_move[player_idx] = True
+            self._table.set_moved(seat)
 
         elif move == GameMove.RAISE:
             """
             RAISE: Set the maximum action (highest bet) to the specified amount 
             """
-            player_action = player.get_action()
+            player_action = self._table.get_action(seat)
             maximum_raise = stack + player_action
 
             """
@@ -645,30 +723,28 @@ class GameData:
             Bet the raise amount and update the maximum action to this amount, setting this player to the
             current aggressor
             """
-            player.bet(amount - player_action)
+            self._table.bet(seat, amount - player_action)
             self._aggressor_pos = player_idx
 
             """
             Indicate that the player has had a turn during this betting round
             """
-            self._hand_players_played_move[player_idx] = True
+            self._table.set_moved(seat)
 
         elif move == GameMove.FOLD:
             """
             FOLD: remove the player from the hand entirely (player action will be reset when action is passed to pot)
             This includes contention in all pots (main and side)
             """
-            self._pot_contenders[-1][player_idx] = None
-            self._prev_action_folded             = True
+            self._prev_action_folded    = True
+            self._pot_eligibility       = [ eligibility & ~( 1 << seat ) for eligibility in self._pot_eligibility ]
 
-            for pot_contenders in self._pot_contenders:
-                
-                for i in range(len(pot_contenders)):
+            self._table.set_moved(seat)
 
-                    if pot_contenders[i] == player:
-                        pot_contenders[i] = None
-
-            self._hand_players_played_move[player_idx] = True
+        """
+        Update the betting state for this one player's move
+        """
+        self._update_betting_state(seat, move, prev_action, stack, was_sufficient, had_moved)
 
         """
         If an amount was set, return the actual amount
@@ -679,25 +755,29 @@ class GameData:
         """
         Consider the player at the given index to have moved even if a move has not been made
         """
-        self._hand_players_played_move[player_idx] = True
+        seat = self._table.get_seat(player_idx)
+
+        if not self._table.has_moved(seat):
+            self._table.set_moved(seat)
+            self._num_to_move -= 1
 
     def set_action_for_all_players(self, action):
         """
         Adjust each player's action to the specified amount
         """
-        for player in self._pot_contenders[-1]:
+        for seat in self._get_contender_seats():
+            """
+            Return all action to each player's stack
+            """
+            player_action = self._table.release_action(seat)
+            self._table.collect_chips(seat, player_action)
 
-            if player is not None:
-                """
-                Return all action to each player's stack
-                """
-                player_action = player.release_action()
-                player.collect_chips(player_action)
+            """
+            Each player re-bets the lowest action
+            """
+            self._table.bet(seat, action)
 
-                """
-                Each player re-bets the lowest action
-                """
-                player.bet(action)
+        self._count_betting_state()
 
     def is_round_over(self):
         """
@@ -708,11 +788,9 @@ class GameData:
         and the action is equal amongst all players
         (exception: a player can have less than maixmum action if the player is all-in)
         """
-        if self.get_num_players_in_hand() > 1:
-            all_players_played          = all(self._hand_players_played_move)
-            max_action                  = self.get_max_action()
-            player_sufficient_actions   = [ player.get_action() == max_action or player.get_stack_size() == 0 for player in self._pot_contenders[-1] if player is not None ]
-            action_is_sufficient        = all(player_sufficient_actions)
+        if self._num_in_hand > 1:
+            all_players_played          = self._num_to_move == 0
+            action_is_sufficient        = self._num_sufficient == self._num_in_hand
             round_over                  = all_players_played and action_is_sufficient
         else:
             """
@@ -728,10 +806,11 @@ class GameData:
     def eliminate_busted_players(self):
         """
         Remove all players who have no more chips
-        And return a copy of all eliminated players
+        And return an immutable view of all eliminated players
         """
-        eliminated_players  = [ deepcopy(player)    for player in self._players if player.get_stack_size() ==   0 ]
-        self._players       = [ player              for player in self._players if player.get_stack_size() >    0 ]
+        busted_seats        = [ seat for seat in self._table.get_seats() if self._table.get_stack_size(seat) == 0 ]
+        eliminated_players  = [ self._table.get_player_view(seat) for seat in busted_seats ]
+        self._table         = self._table.without_seats(busted_seats)
 
         """
         Return Result
@@ -740,10 +819,10 @@ class GameData:
 
     def rotate_dealer(self):
         """
-        Set the new dealer to the player left of the current dealer and re-order players by dealer
+        Set the new dealer to the player left of the current dealer (only the dealer seat changes)
         """
         new_dealer_idx = self.get_next_player_pos(GameData.DEALER_IDX, only_in_hand=False)
-        self._order_players(new_dealer_idx)
+        self._table.set_dealer_seat( self._table.get_seat(new_dealer_idx) )
     
     def clear_board(self):
         """
@@ -755,43 +834,143 @@ class GameData:
         """
         Remove hole cards from each player and reset/shuffle the deck
         """
-        for player in self._players:
-            player.pass_hole_cards()
-        
-        self._deck.reset()
-        self._deck.shuffle()
+        for seat in range(self._table.get_num_seats()):
+            self._table.pass_hole_cards(seat)
+
+        """
+        Move on to the next hand's deck
+        """
+        self._game_setup.hand_number += 1
+        self._shuffle_deck()
+
+    """
+    State Methods
+    """
+    def snapshot(self):
+        """
+        Capture the state of the hand (the table's seat arrays, pots, contenders, board, deck cursor and
+        betting round flags) as a flat tuple to be passed back to restore
+        This lets a search apply moves with play_move, look ahead, and undo them without copying the game data
+        """
+        return (
+            self._table.clone(),
+            tuple(self._pot),
+            tuple(self._pot_eligibility),
+            tuple(self._board),
+            self._deck.get_cursor(),
+            self._aggressor_pos,
+            self._prev_action_folded,
+            self._big_blind_amt,
+            self._max_action,
+            self._num_in_hand,
+            self._num_available_betters,
+            self._num_sufficient,
+            self._num_to_move
+        )
+
+    def restore(self, snapshot):
+        """
+        Return the hand to a state captured by snapshot (the table and lists are restored in place)
+        The deck's random number generator is not rewound: cards drawn after the snapshot go back into the deck,
+        but a shuffled deck may deal different cards in their place
+        """
+        (
+            table,
+            self._pot[:],
+            self._pot_eligibility[:],
+            self._board[:],
+            deck_cursor,
+            self._aggressor_pos,
+            self._prev_action_folded,
+            self._big_blind_amt,
+            self._max_action,
+            self._num_in_hand,
+            self._num_available_betters,
+            self._num_sufficient,
+            self._num_to_move
+        ) = snapshot
+
+        self._table.copy_from(table)
+        self._deck.return_cards(deck_cursor)
 
     """
     Private Methods
     """
-    def _order_players(self, dealer_idx):
+    def _shuffle_deck(self):
         """
-        Rotate/Cut the list of players so that the player at the dealer index is first on the list
+        Reset and shuffle the deck with a seed derived from the game seed and the hand number
+        so that every hand's deal can be reproduced from the game seed alone
         """
-        self._players = self._players[dealer_idx:] + self._players[:dealer_idx]
+        self._deck.reset()
+        self._deck.seed( GameRandom.derive_seed(self._game_setup.seed, self._game_setup.hand_number) )
+        self._deck.shuffle()
 
-    def _create_side_pot(self):
+    def _is_contender(self, seat, pot_idx=-1):
         """
-        Create a side pot that is initially empty
+        Check if the player in the given seat is eligible to win the pot at the given index
         """
-        self._pot.append(0)
+        return ( self._pot_eligibility[pot_idx] >> seat ) & 1 == 1
 
+    def _get_contender_seats(self, pot_idx=-1):
         """
-        Add a list of all players contending for this side pot (any players who still have chips)
+        Get the seat of each player contending for the pot at the given index (in order of seat)
         """
-        new_pot_contenders = list()
+        eligibility = self._pot_eligibility[pot_idx]
+        return [ seat for seat in range(self._table.get_num_seats()) if ( eligibility >> seat ) & 1 ]
 
-        for player in self._pot_contenders[-1]:
+    def _is_action_sufficient(self, seat):
+        """
+        Check if a player's action is enough to end the betting round (it matches the highest bet or the player is all-in)
+        """
+        return self._table.get_action(seat) == self._max_action or self._table.get_stack_size(seat) == 0
 
-            if player is None or ( player.get_stack_size() + player.get_action() ) > 0:
-                """
-                Add element directly if it is already None or has a stack size of 0
-                """
-                new_pot_contenders.append(player)
-            else:
-                """
-                Add a "None" placeholder to preserve table order
-                """
-                new_pot_contenders.append(None)
+    def _count_betting_state(self):
+        """
+        Recount the betting state of the newest pot from scratch
+        This is only needed when the pots, contenders, or every player's action change at once
+        """
+        in_hand                         = len(self._pot_eligibility) > 0
+        contender_seats                 = self._get_contender_seats() if in_hand else list()
+        actions                         = self._table.get_column(TableState.ACTION)
+        stacks                          = self._table.get_column(TableState.STACK)
+
+        self._num_in_hand               = len(contender_seats)
+        self._max_action                = max([ actions[seat] for seat in contender_seats ], default=0)
+        self._num_available_betters     = len([ seat for seat in contender_seats if stacks[seat] > 0 ])
+        self._num_sufficient            = len([ seat for seat in contender_seats if actions[seat] == self._max_action or stacks[seat] == 0 ])
+        self._num_to_move               = self._table.get_num_seats() - int(sum(self._table.get_column(TableState.MOVED))) if in_hand else 0
+
+    def _update_betting_state(self, seat, move, prev_action, prev_stack, was_sufficient, had_moved):
+        """
+        Update the betting state after one player's move without rescanning the table
+        Only a change to the highest bet requires a recount: a new highest bet,
+        or the player with the highest bet folding or lowering it (a raise to less than the player's own action)
+        """
+        if not had_moved:
+            self._num_to_move -= 1
+
+        if move == GameMove.FOLD:
+            """
+            The player no longer contends for the pot
+            """
+            self._num_in_hand           -= 1
+            self._num_available_betters -= prev_stack > 0
+            self._num_sufficient        -= was_sufficient
+
+            if self._table.get_action(seat) == self._max_action:
+                self._count_betting_state()
 
-        self._pot_contenders.append(new_pot_contenders)
+        else:
+            """
+            The player may have run out of chips and may have changed the highest bet
+            """
+            action                      = self._table.get_action(seat)
+            self._num_available_betters += ( self._table.get_stack_size(seat) > 0 ) - ( prev_stack > 0 )
+
+            if action > self._max_action:
+                self._max_action        = action
+                self._num_sufficient    = len([ contender_seat for contender_seat in self._get_contender_seats() if self._is_action_sufficient(contender_seat) ])
+            elif prev_action == self._max_action and action < self._max_action:
+                self._count_betting_state()
+            else:
+                self._num_sufficient    += self._is_action_sufficient(seat) - was_sufficient
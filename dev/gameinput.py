@@ -8,7 +8,14 @@ Imports
 """
 from os                 import name                     as os_name
 from os                 import system                   as os_system
-from pynput.keyboard    import Key, KeyCode, Listener
+
+"""
+Hot keys need pynput, which is not required to run a game without a keyboard (e.g. headless games)
+"""
+try:
+    from pynput.keyboard    import Key, KeyCode, Listener
+except ImportError:
+    Key = KeyCode = Listener = None
 
 class GameInput:
 
@@ -27,7 +34,12 @@ class GameInput:
     """
     Select hot key values based on OS
     """
-    if os_name == OS_WINDOWS_NAME:
+    if Listener is None:
+        """
+        NO HOTKEYS (pynput is not installed)
+        """
+        GAME_SAVE = ( "None",       "Save the game progress",           tuple() )
+    elif os_name == OS_WINDOWS_NAME:
         """
         WINDOWS HOTKEYS
 
@@ -96,7 +108,11 @@ class GameInput:
     def listen_for_hot_keys(self):
         """
         Create and start a hot key listener thread and have it die when the main thread is finished (daemon)
+        There is nothing to listen with if pynput is not installed
         """
+        if Listener is None:
+            return
+
         listener = Listener(on_press=self._handle_key_press, on_release=self._handle_key_release)
         listener.setDaemon(True)
         listener.start()
@@ -0,0 +1,76 @@
+"""
+GameRandom:
+    Creates the random number generators used by the game and derives independent seeds from a game seed
+    Every generator follows the standard random.Random interface
+"""
+
+"""
+Imports
+"""
+from os             import urandom
+from random         import Random
+
+from counterrandom  import CounterRandom
+
+class GameRandom:
+    """
+    Constants
+    """
+    KIND_MERSENNE   = "mersenne"    ### Standard library generator (default)
+    KIND_NUMPY      = "numpy"       ### NumPy Generator (requires NumPy)
+    KIND_COUNTER    = "counter"     ### Counter-based generator (independent keyed streams)
+
+    SEED_BYTES      = 8
+    SEED_BITS       = SEED_BYTES * 8
+
+    EXCEPTION_UNKNOWN_KIND = "Unrecognized random number generator kind [%s]"
+
+    """
+    Static Methods
+    """
+    @staticmethod
+    def create(seed=None, kind=KIND_MERSENNE):
+        """
+        Create a generator of the given kind (an unseeded generator is seeded from the operating system)
+        """
+        rng = None
+
+        if kind == GameRandom.KIND_MERSENNE:
+            rng = Random(seed)
+        elif kind == GameRandom.KIND_COUNTER:
+            rng = CounterRandom(seed)
+        elif kind == GameRandom.KIND_NUMPY:
+            """
+            Only import NumPy if it is actually used
+            """
+            from numpyrandom import NumpyRandom
+            rng = NumpyRandom(seed)
+        else:
+            raise Exception(GameRandom.EXCEPTION_UNKNOWN_KIND % kind)
+
+        """
+        Return Result
+        """
+        return rng
+
+    @staticmethod
+    def new_seed():
+        """
+        Get a fresh 64-bit seed from the operating system
+        """
+        return int.from_bytes(urandom(GameRandom.SEED_BYTES), "little")
+
+    @staticmethod
+    def draw_seed(rng):
+        """
+        Draw a seed for another generator from an existing generator
+        """
+        return rng.getrandbits(GameRandom.SEED_BITS)
+
+    @staticmethod
+    def derive_seed(seed, stream):
+        """
+        Derive the seed of an independent stream (e.g. one hand or one worker) from a game seed
+        The same seed and stream number always give the same derived seed
+        """
+        return CounterRandom.mix( ( seed + ( stream + 1 ) * CounterRandom.GOLDEN_GAMMA ) & CounterRandom.MASK_64 )
@@ -1,17 +1,34 @@
 """
 GameSave:
     Manages saving a game in its state to a persistent file
+
+    The file is an append-only journal: a header, a fixed-size summary block (see SaveSummary),
+    then one record for the game setup and one record per hand
+    Each record is its length and checksum followed by its data, so a save only appends the hands
+    played since the last save, and a record torn by a crash is detected (and cut off) when the game is loaded
+    A journal written from scratch goes to a temporary file that replaces the save file only once it is on disk,
+    so a crash while rewriting leaves the previous save intact
+    The setup is pickled and each hand is stored in the compact binary format of HandRecord
+    The summary block is rewritten in place after each save, so a game can be checked for completion by reading the
+    start of its file only (the block holds the file size it describes, so a block left stale by an interrupted save is ignored)
+    Older saves (files written as a single pickle of (setup, hands)) can still be loaded
 """
 
 """
 Imports
 """
 from copy       import deepcopy
+from math       import isnan
+from os         import SEEK_END, fsync, remove, replace
 from os.path    import exists, join
 from pickle     import dumps, loads
+from struct     import Struct
+from zlib       import crc32
 
-from gamedata   import GameData
-from gamesetup  import GameSetup
+from gamedata       import GameData
+from gamesetup      import GameSetup
+from handrecord     import HandRecord
+from savesummary    import SaveSummary
 
 class GameSave:
     """
@@ -19,7 +36,16 @@ class GameSave:
     """
     FILE_WRITE_CODE     = "wb"
     FILE_READ_CODE      = "rb"
+    FILE_UPDATE_CODE    = "r+b"
     GAME_SAVE_FILE_EXT  = ".pok"
+    TEMP_FILE_EXT       = ".tmp"            ### Added to the save file name while a new journal is being written
+    JOURNAL_HEADER      = b"POKJOURNAL3\n"  ### Marks a journal file (anything else is an older save)
+    RECORD_HEADER       = Struct(">II")     ### Length and CRC-32 checksum of a record's data
+    SUMMARY_FIELDS      = Struct(">QIHBId") ### File size, number of hands, number of players left, complete flag, round number, timestamp
+    SUMMARY_CHECKSUM    = Struct(">I")      ### CRC-32 checksum of the summary fields
+    SUMMARY_OFFSET      = len(JOURNAL_HEADER)                                           ### Offset of the summary block in a journal file
+    RECORDS_OFFSET      = SUMMARY_OFFSET + SUMMARY_FIELDS.size + SUMMARY_CHECKSUM.size  ### Offset of the first record in a journal file
+    NO_TIMESTAMP        = float("nan")      ### Stored timestamp if there is none
 
     """
     Constructor
@@ -30,7 +56,13 @@ class GameSave:
         """
         self._save_name             = save_name     ### Name of the serialized file
         self._save_setup            = None          ### Object containing game setup data
-        self._save_hands            = list()        ### Object containing a list hands played in the game
+        self._save_hands            = list()        ### List of the hands played in the game (each encoded as a HandRecord)
+
+        """
+        Journal state
+        """
+        self._num_saved_hands       = 0         ### Number of hands already written to the journal file
+        self._rewrite_needed        = True      ### Must the journal file be written from scratch at the next save?
 
         """
         Save hand buffer objects
@@ -43,6 +75,89 @@ class GameSave:
         self._player_state_final    = list()    ### Buffer variable to hold all player data after a hand
         self._timestamp_final       = 0         ### Buffer variable to hold the blind timestamp after a hand
 
+    """
+    Static Methods
+    """
+    @staticmethod
+    def is_journal(file_start):
+        """
+        Check if a file starts with the journal header
+        """
+        return file_start[ : len(GameSave.JOURNAL_HEADER) ] == GameSave.JOURNAL_HEADER
+
+    @staticmethod
+    def _pack_summary(summary, file_size):
+        """
+        Pack a summary as a summary block describing a file of the given size
+        """
+        fields = GameSave.SUMMARY_FIELDS.pack(
+            file_size,
+            summary.num_hands,
+            summary.num_players,
+            summary.complete,
+            summary.round_number,
+            summary.timestamp if summary.timestamp is not None else GameSave.NO_TIMESTAMP
+        )
+
+        """
+        Return Result
+        """
+        return fields + GameSave.SUMMARY_CHECKSUM.pack(crc32(fields))
+
+    @staticmethod
+    def _unpack_summary(block, file_size):
+        """
+        Unpack a summary block
+        Return None if the block is corrupt or describes a file of another size (the save was interrupted after the block was last written)
+        """
+        fields_size = GameSave.SUMMARY_FIELDS.size
+
+        if len(block) < fields_size + GameSave.SUMMARY_CHECKSUM.size:
+            return None
+
+        summary_size, num_hands, num_players, complete, round_number, timestamp = GameSave.SUMMARY_FIELDS.unpack_from(block)
+        checksum,                                                               = GameSave.SUMMARY_CHECKSUM.unpack_from(block, fields_size)
+
+        if crc32(block[ : fields_size ]) != checksum or summary_size != file_size:
+            return None
+
+        """
+        Return Result
+        """
+        return SaveSummary(num_hands, num_players, complete == 1, round_number, timestamp if not isnan(timestamp) else None)
+
+    @staticmethod
+    def _pack_record(data):
+        """
+        Frame data as a journal record (length, checksum, data)
+        """
+        return GameSave.RECORD_HEADER.pack(len(data), crc32(data)) + data
+
+    @staticmethod
+    def _unpack_records(file_data, offset):
+        """
+        Read the data of every intact record from the given offset on
+        Return the record data and the offset at the end of the last intact record (a torn or corrupt record ends the journal)
+        """
+        records     = list()
+        header_size = GameSave.RECORD_HEADER.size
+
+        while offset + header_size <= len(file_data):
+            data_size, checksum = GameSave.RECORD_HEADER.unpack_from(file_data, offset)
+            data_start          = offset + header_size
+            data                = file_data[ data_start : data_start + data_size ]
+
+            if len(data) < data_size or crc32(data) != checksum:
+                break
+
+            records.append(data)
+            offset = data_start + data_size
+
+        """
+        Return Result
+        """
+        return (records, offset)
+
     """
     Getter Methods
     """
@@ -52,8 +167,49 @@ class GameSave:
     def get_game_save(self):
         """
         Return a copy of the saved game's setup and hand history
+        (each hand is decoded into new objects, so only the setup needs to be copied)
+        """
+        return ( deepcopy(self._save_setup), [ HandRecord.decode(hand) for hand in self._save_hands ] )
+
+    def get_summary(self, num_hands=None):
+        """
+        Summarize the game in the setup and the given number of first hands (every hand by default),
+        as it is written to the summary block at the next save
+        """
+        if num_hands is None:
+            num_hands = len(self._save_hands)
+
+        if num_hands > 0:
+            round_number, _, num_players, timestamp = HandRecord.get_summary(self._save_hands[ num_hands - 1 ])
+        else:
+            round_number, num_players, timestamp    = self._save_setup.round_number, self._save_setup.starting_num_players, None
+
+        """
+        Return Result
+        """
+        return SaveSummary(num_hands, num_players, num_hands > 0 and num_players == 1, round_number, timestamp)
+
+    def read_summary(self):
+        """
+        Read the summary block of the save file without loading the rest of the file
+        Return None if there is no save file, if the file has no summary block (an older save),
+        or if the block is out of date (the last save was interrupted), in which case the file must be loaded to summarize it
+        """
+        if not self.save_exists():
+            return None
+
+        save_file   = open(self._get_file_name(), GameSave.FILE_READ_CODE)
+        file_start  = save_file.read(GameSave.RECORDS_OFFSET)
+        file_size   = save_file.seek(0, SEEK_END)
+        save_file.close()
+
+        if not GameSave.is_journal(file_start):
+            return None
+
         """
-        return deepcopy( ( self._save_setup, self._save_hands ) )
+        Return Result
+        """
+        return GameSave._unpack_summary(file_start[ GameSave.SUMMARY_OFFSET : ], file_size)
 
     """
     Game "Snapshot" Methods
@@ -61,8 +217,10 @@ class GameSave:
     def snap_game_setup(self, setup):
         """
         Store the game setup data in the setup buffer object
+        A new setup starts a new journal file at the next save
         """
-        self._save_setup = setup
+        self._save_setup        = setup
+        self._rewrite_needed    = True
 
     def begin_hand_snapshot(self, round_number, player_state, timestamp):
         """
@@ -81,7 +239,10 @@ class GameSave:
         self._player_state_final    = player_state
         self._timestamp_final       = timestamp
 
-        self._save_hands.append((
+        """
+        Encode the hand right away (the game reuses its buffers in the next hand)
+        """
+        self._save_hands.append(HandRecord.encode((
             self._round_number,
             self._player_state_init,
             self._timestamp_init,
@@ -89,16 +250,17 @@ class GameSave:
             self._cards,
             self._player_state_final,
             self._timestamp_final
-        ))
+        )))
 
     """
     Public Methods
     """
     def clear_hand_history(self):
         """
-        Remove all saved hands from the hand list
+        Remove all saved hands from the hand list (the journal file is written from scratch at the next save)
         """
         self._save_hands.clear()
+        self._rewrite_needed = True
 
     def save(self):
         """
@@ -108,25 +270,53 @@ class GameSave:
 
         try:
             """
-            Create a save file object (this will overwrite an existing file of the same name)
-            then package and serialize setup and hand history objects to a serialized string
+            Only append the hands played since the last save to the journal
+            Start a new journal (overwriting an existing file of the same name) if the setup or history was replaced
             """
-            save_file               = open("%s%s" % (self._save_name, GameSave.GAME_SAVE_FILE_EXT), GameSave.FILE_WRITE_CODE)
-            save_obj                = ( self._save_setup, self._save_hands )
-            serialized_setup_obj    = dumps( save_obj )
+            new_hands_idx   = self._num_saved_hands
+            records         = list()
 
-            """
-            Write the serialized data string to the file
-            """
-            save_file.write( serialized_setup_obj )
+            if not self.save_exists():
+                self._rewrite_needed = True
+
+            if self._rewrite_needed:
+                new_hands_idx   = 0
+                records         = [ GameSave._pack_record( dumps(self._save_setup) ) ]
 
             """
-            Close the file stream
+            Take the new hands once: the game thread can add a hand while the hot key thread saves,
+            and a hand added after this point is left for the next save (it is not counted as saved)
             """
-            save_file.close()
+            new_hands       = self._save_hands[new_hands_idx:]
+            num_hands       = new_hands_idx + len(new_hands)
+            records         += [ GameSave._pack_record(hand) for hand in new_hands ]
+            journal_data    = b"".join(records)
+
+            if self._rewrite_needed:
+                """
+                Write the header, summary block, and every record to a new file
+                """
+                file_size = GameSave.RECORDS_OFFSET + len(journal_data)
+                self._replace_file( GameSave.JOURNAL_HEADER + GameSave._pack_summary(self.get_summary(num_hands), file_size) + journal_data )
+            else:
+                """
+                Append the new records, then update the summary block to describe them and close the file stream
+                """
+                save_file = open(self._get_file_name(), GameSave.FILE_UPDATE_CODE)
+                file_size = save_file.seek(0, SEEK_END) + len(journal_data)
+                save_file.write(journal_data)
+                self._write_summary(save_file, file_size, num_hands)
+                save_file.close()
+
+            self._num_saved_hands   = num_hands
+            self._rewrite_needed    = False
 
         except:
-            save_clean = False
+            """
+            A failed save may have left part of a record behind, so write the journal from scratch next time
+            """
+            save_clean              = False
+            self._rewrite_needed    = True
 
         """
         Return Result
@@ -135,24 +325,55 @@ class GameSave:
 
     def load(self):
         """
-        Create a save file object (this will overwrite an existing file of the same name)
-        then deserialize the file data and unpackage them in the setup and hands buffers
+        Read the save file and unpackage it in the setup and hands buffers
+        A journal with a torn or corrupt record at the end is cut off after its last intact record
         """
-        load_file                           = open("%s%s" % (self._save_name, GameSave.GAME_SAVE_FILE_EXT), GameSave.FILE_READ_CODE)
-        file_data                           = load_file.read()
-        file_rebuild                        = loads(file_data)
-        self._save_setup, self._save_hands  = file_rebuild
+        load_file = open(self._get_file_name(), GameSave.FILE_READ_CODE)
+        file_data = load_file.read()
 
         """
         Close the file stream
         """
         load_file.close()
 
+        if GameSave.is_journal(file_data):
+            """
+            Journal: the first record is the setup and every other record is a hand (kept encoded until it is needed)
+            """
+            records, intact_size                = GameSave._unpack_records(file_data, GameSave.RECORDS_OFFSET)
+            self._save_setup                    = loads(records[0])
+            self._save_hands                    = records[1:]
+            self._num_saved_hands               = len(self._save_hands)
+            self._rewrite_needed                = False
+
+            """
+            Cut off a torn record and bring a summary block left out of date by an interrupted save up to date
+            """
+            summary_block   = file_data[ GameSave.SUMMARY_OFFSET : GameSave.RECORDS_OFFSET ]
+            summary_stale   = GameSave._unpack_summary(summary_block, intact_size) is None
+
+            if intact_size < len(file_data) or summary_stale:
+                self._repair_file(intact_size, summary_stale)
+
+        else:
+            """
+            Older save: the whole file is a single pickle of (setup, hands) (it is rewritten as a journal at the next save)
+            """
+            self._save_setup, saved_hands       = loads(file_data)
+            self._save_hands                    = [ HandRecord.encode(hand) for hand in saved_hands ]
+            self._rewrite_needed                = True
+
     def save_exists(self):
         """
         Check if a save file of the same name already exists in this directory
         """
-        return exists( self._save_name + GameSave.GAME_SAVE_FILE_EXT )
+        return exists( self._get_file_name() )
+
+    def is_saved(self):
+        """
+        Check if every hand is in the save file as a journal (so the file can be read by a HandHistory)
+        """
+        return not self._rewrite_needed and self._num_saved_hands == len(self._save_hands) and self.save_exists()
 
     def is_game_complete(self):
         """
@@ -165,14 +386,59 @@ class GameSave:
         """
         if len(self._save_hands) > 0:
             """
-            Parse the most recent hand to get the player data
-            """
-            last_hand = self._save_hands[-1]
-            _, _, _, _, _, players, _ = last_hand
-
-            """
-            Game is complete if and only if there is only one player remaining in the game
+            Game is complete if and only if there is only one player remaining in the game after the most recent hand
             """
-            is_game_complete = len(players) == 1
+            is_game_complete = HandRecord.get_num_final_players(self._save_hands[-1]) == 1
 
         return is_game_complete
+
+    """
+    Private Methods
+    """
+    def _get_file_name(self):
+        return "%s%s" % (self._save_name, GameSave.GAME_SAVE_FILE_EXT)
+
+    def _replace_file(self, data):
+        """
+        Replace the save file with a new one holding the given data
+        The data is written and flushed to disk in a temporary file first, which then takes the save file's place in one step
+        (a failed write removes the temporary file and leaves the save file as it was)
+        """
+        file_name   = self._get_file_name()
+        temp_name   = "%s%s" % (file_name, GameSave.TEMP_FILE_EXT)
+        temp_file   = open(temp_name, GameSave.FILE_WRITE_CODE)
+
+        try:
+            temp_file.write(data)
+            temp_file.flush()
+            fsync(temp_file.fileno())
+            temp_file.close()
+
+            replace(temp_name, file_name)
+
+        except:
+            temp_file.close()
+
+            if exists(temp_name):
+                remove(temp_name)
+
+            raise
+
+    def _write_summary(self, save_file, file_size, num_hands=None):
+        """
+        Overwrite the summary block of an open save file (describing the given number of first hands, every hand by default)
+        """
+        save_file.seek(GameSave.SUMMARY_OFFSET)
+        save_file.write( GameSave._pack_summary(self.get_summary(num_hands), file_size) )
+
+    def _repair_file(self, size, rewrite_summary):
+        """
+        Cut the save file off at the given size (and rewrite its summary block)
+        """
+        save_file = open(self._get_file_name(), GameSave.FILE_UPDATE_CODE)
+        save_file.truncate(size)
+
+        if rewrite_summary:
+            self._write_summary(save_file, size)
+
+        save_file.close()
@@ -3,11 +3,22 @@ GameSetup:
     Collection of data representing the setup information for a poker game
 """
 
+"""
+Imports
+"""
+from blindschedule  import BlindSchedule
+from gamerandom     import GameRandom
+
 class GameSetup:
+    """
+    Constants
+    """
+    FIXED_BLINDS_SCHEME = lambda old_blinds, initial_blinds: initial_blinds ### Scheme used if none is given (the blinds never increase)
+
     """
     Constructor:
         This class is a collection of named data values (like a struct)
-        No methods are necessary and all properties are public
+        All properties are public (the only method builds the blind schedule on first use)
     """
     def __init__(self):
         """
@@ -17,12 +28,39 @@ class GameSetup:
         self.starting_num_players       = 0                                                 ### Number of players to begin the game
         self.starting_chip_count        = 0                                                 ### Initial chip count for each player in the game
         self.starting_big_blind         = 0                                                 ### Initial value of the big blind
-        self.blind_increase_scheme      = lambda old_blinds, initial_blinds: initial_blinds ### Scheme for increasing the blinds over time
+        self.blind_increase_scheme      = None                                              ### Scheme for increasing the blinds over time (None: the blinds never increase)
         self.blind_increase_interval    = 0                                                 ### Rate (in minutes) that the blinds increase
+        self.blind_schedule             = None                                              ### Big blind and ante of every round (built from the blind increase scheme if not given)
+        self.ante_ratio                 = 0                                                 ### Size of the ante as a fraction of the big blind when the schedule is built from the scheme (no antes by default)
         self.handle_time_expired        = lambda: None                                      ### Callback function called when the blind timer goes off (raising blinds)
         self.init_timestamp             = 0                                                 ### Initial time to set the blind timer to (could be less than blind interval if game is loaded)
         self.round_number               = 0                                                 ### Current round number (relatd to number of times the blinds have increased)
         self.init_player_state          = list()                                            ### Initial data for all players
+        self.seed                       = None                                              ### Seed for the game's random number generators (any hand can be replayed from it)
+        self.rng_kind                   = GameRandom.KIND_MERSENNE                          ### Kind of random number generator to use
+        self.hand_number                = 0                                                 ### Number of hands dealt so far (each hand's deck is seeded from it)
+
+    """
+    Blind Schedule
+    """
+    def get_blind_schedule(self):
+        """
+        Get the blind schedule, building it from the blind increase scheme the first time it is needed
+        The table is kept on the setup, so loading, playback and live play all share (and save) the same one
+        The blinds are maxed out once the big blind meets or exceeds half of the value of every single chip in the game
+        """
+        if self.blind_schedule is None:
+            self.blind_schedule = BlindSchedule.from_scheme(
+                self.starting_big_blind,
+                self.blind_increase_scheme if self.blind_increase_scheme is not None else GameSetup.FIXED_BLINDS_SCHEME,
+                ( self.starting_chip_count * self.starting_num_players ) / 2,
+                ante_ratio=self.ante_ratio
+            )
+
+        """
+        Return Result
+        """
+        return self.blind_schedule
 
     """
     Get State Override
@@ -51,3 +89,11 @@ class GameSetup:
         Return Result
         """
         return state
+
+    """
+    Set State Override
+    This restores transient and newer properties to their defaults when loading an older or serialized setup
+    """
+    def __setstate__(self, state):
+        self.__init__()
+        self.__dict__.update(state)
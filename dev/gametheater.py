@@ -6,7 +6,8 @@ GameTheater:
 """
 Imports
 """
-from gameui import GameUI
+from gameui     import GameUI
+from playerview import PlayerView
 
 class GameTheater:
     """
@@ -16,9 +17,10 @@ class GameTheater:
         """
         Properties
         """
-        self._setup = setup     ### Game setup data
-        self._hands = hands     ### List of all played hands in the game
-        self._ui    = GameUI()  ### Interface object to display game history
+        self._setup         = setup     ### Game setup data
+        self._hands         = hands     ### All played hands in the game in order (a list, a HandHistory, or any iterator streaming them)
+        self._final_state   = None      ### Copy of the player states after the most recently displayed hand
+        self._ui            = GameUI()  ### Interface object to display game history
 
     """
     Public Methods
@@ -66,15 +68,13 @@ class GameTheater:
             """
             Gather all data from the hand
             """
-            round_number, init_player_state, timestamp_init, actions, cards, _, _   = hand
-            starting_big_blind                                                      = self._setup.starting_big_blind
-            current_big_blind                                                       = starting_big_blind
+            round_number, init_player_state, timestamp_init, actions, cards, final_player_state, _  = hand
+            current_big_blind                                                                       = self._setup.get_blind_schedule().get_big_blind(round_number)
 
             """
-            Determine the current big blind size
+            Copy the final player states out of the hand: the hand history can be closed once playback ends
             """
-            for _ in range(1, round_number):
-                current_big_blind = self._setup.blind_increase_scheme(current_big_blind, starting_big_blind)
+            self._final_state = tuple(map(PlayerView.from_player, final_player_state))
 
             """
             Display all hand data
@@ -95,10 +95,10 @@ class GameTheater:
         Make the following assumptions:
             * The game has had at least one completed hand
             * There is one and only one player left after the most recent hand
+
+        The hands are only gone through once (so they can be streamed), so the last final state copied is the most recent one
         """
-        last_hand                               = self._hands[-1]
-        _, _, _, _, _, player_state_final, _    = last_hand
-        winner                                  = player_state_final[0]
+        winner = self._final_state[0]
 
         """
         Display the winner
@@ -7,8 +7,8 @@ GameTimer:
 Imports
 """
 from datetime   import timedelta
-from threading  import Timer
-from time       import time
+
+from gameclock  import GameClock
 
 class GameTimer:
     """
@@ -20,16 +20,16 @@ class GameTimer:
     """
     Constructor
     """
-    def __init__(self, interval_time, callback, init_start_time=0):
+    def __init__(self, interval_time, callback, init_start_time=0, clock=None):
         """
         Properties
         """
         self._callback              = callback          ### Callback function to call when time is up
+        self._clock                 = clock if clock is not None else GameClock()   ### Source of the current time (the wall clock by default)
         self._current_interval_time = 0                 ### TIme value that the timer is currently set to
         self._init_start_time       = init_start_time   ### Time value to use first before using the normal interval time
         self._interval_time         = interval_time     ### Time to set the timer to (in minutes)
         self._start_time            = 0                 ### Time when the timer is activated
-        self._timer                 = None              ### Timer thread object
 
     """
     Static Methods
@@ -83,7 +83,7 @@ class GameTimer:
             Get the elapsed time (current time minus start time)
             and the interval time
             """
-            current_time    = time()
+            current_time    = self._clock.get_time()
             elapsed_time    = current_time - self._start_time
             interval_time   = self._current_interval_time
 
@@ -123,13 +123,10 @@ class GameTimer:
             callback = self._modified_callback
 
         """
-        Create a new timer instance to call the callback function at the blind time interval
-        Set the thread as a daemon thread so that it will terminate immediately if the game is over
+        Have the clock call the callback function at the blind time interval
         """
-        self._timer         = Timer(GameTimer.convert_min_to_sec(self._current_interval_time), callback)
-        self._timer.daemon  = True
-        self._start_time    = time()
-        self._timer.start()
+        self._start_time = self._clock.get_time()
+        self._clock.call_later(interval_time_seconds, callback)
 
     """
     Private Methods
@@ -0,0 +1,53 @@
+"""
+GameView:
+    Immutable snapshot of the table as seen by the player who is about to act
+    Players are listed by position (the dealer is at position 0) and only the acting player's hole cards are included
+"""
+
+"""
+Imports
+"""
+from collections import namedtuple
+
+class GameView(namedtuple("GameView", [
+    "position",         ### Position of the acting player
+    "players",          ### PlayerView of every player in the game by position
+    "in_hand",          ### Is the player at each position still in the hand?
+    "board",            ### Community cards
+    "pots",             ### Size of each pot (main and side) including the action in play
+    "max_action",       ### Size of the highest bet in play
+    "big_blind",        ### Current size of the big blind
+    "round_number",     ### Current round number (number of blind levels)
+    "preflop",          ### Is this the preflop betting round?
+    "time_budget",      ### Number of seconds the acting player has to decide (None for no limit)
+    "equity"            ### Estimated equity of the acting player's hand (None unless the acting agent uses it, see PokerAgent.USES_EQUITY)
+])):
+    """
+    Tuple Layout
+    """
+    __slots__ = ()
+
+    """
+    Getter Methods
+    """
+    def get_player(self):
+        """
+        Get the view of the acting player
+        """
+        return self.players[self.position]
+
+    def get_amount_to_call(self):
+        """
+        Get the number of chips the acting player needs to add to match the highest bet
+        """
+        player = self.players[self.position]
+        return min(self.max_action - player.get_action(), player.get_stack_size())
+
+    def get_total_pot(self):
+        return sum(self.pots)
+
+    def get_num_players_in_hand(self):
+        return sum(self.in_hand)
+
+    def get_num_opponents(self):
+        return self.get_num_players_in_hand() - 1
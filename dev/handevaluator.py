@@ -0,0 +1,397 @@
+"""
+HandEvaluator:
+    Maps any poker hand to a single integer strength using lookup tables built once at import
+    A higher strength is always a better hand, and two hands of equal strength are a tie
+    Hands of 6 or 7 cards are given the strength of the best 5-card hand that can be made from them
+"""
+
+"""
+Imports
+"""
+from collections    import Counter
+from itertools      import combinations, combinations_with_replacement
+
+from card           import Card
+
+class HandEvaluator:
+    """
+    Constants
+    """
+    TYPE_UNKNOWN            = -1
+    TYPE_HIGH_CARD          = 0
+    TYPE_PAIR               = 1
+    TYPE_TWO_PAIR           = 2
+    TYPE_THREE_OF_A_KIND    = 3
+    TYPE_STRAIGHT           = 4
+    TYPE_FLUSH              = 5
+    TYPE_FULL_HOUSE         = 6
+    TYPE_FOUR_OF_A_KIND     = 7
+    TYPE_STRAIGHT_FLUSH     = 8
+
+    HAND_SIZE               = 5
+    MAX_CARDS               = 7     ### Largest number of cards that can be evaluated at once (hole cards + board)
+    STRENGTH_UNKNOWN        = 0     ### Strength reported for anything that is not a valid hand
+
+    """
+    Flush detection (see the card code layout in Card)
+    """
+    FLUSH_COUNTER_BIAS  = 0x3333    ### Adding 3 to a suit counter sets its high bit if it counted 5 or more cards
+    FLUSH_COUNTER_MASK  = 0x8888
+
+    MAX_COUNT_PER_VALUE = 4     ### A value can appear at most once per suit
+
+    VALUE_MULTIPLICITIES = {    ### Number of cards used for each ordered hand value (1 card per value if not listed)
+        TYPE_PAIR               : [ 2, 1, 1, 1 ],
+        TYPE_TWO_PAIR           : [ 2, 2, 1 ],
+        TYPE_THREE_OF_A_KIND    : [ 3, 1, 1 ],
+        TYPE_FULL_HOUSE         : [ 3, 2 ],
+        TYPE_FOUR_OF_A_KIND     : [ 4, 1 ]
+    }
+
+    """
+    Lookup Tables (populated by _build_tables when the module is imported)
+    """
+    _flush_table        = list()    ### Rank bit pattern of a flush -> strength
+    _unique_table       = list()    ### Rank bit pattern of 5 unique non-flush values -> strength
+    _product_table      = dict()    ### Product of rank primes of a hand with repeated values -> strength
+    _flush_best_table   = list()    ### Rank bit pattern of 5 to 7 suited cards -> strength of the best flush
+    _rank_table         = dict()    ### Product of rank primes of 5 to 7 cards -> strength of the best non-flush hand
+    _rankings           = list()    ### Strength -> (hand type, ordered hand values)
+
+    """
+    Static Methods
+    """
+    @staticmethod
+    def evaluate(cards):
+        """
+        Get the strength of a 5-card hand
+        """
+        strength = HandEvaluator.STRENGTH_UNKNOWN
+
+        if len(cards) == HandEvaluator.HAND_SIZE:
+            codes       = [ card.get_code() for card in cards ]
+            strength    = HandEvaluator.evaluate_codes(*codes)
+
+        """
+        Return Result
+        """
+        return strength
+
+    @staticmethod
+    def evaluate_codes(c1, c2, c3, c4, c5):
+        """
+        Get the strength of 5 card codes
+
+        All five cards share a suit bit: the hand is a flush (or straight flush)
+        """
+        if c1 & c2 & c3 & c4 & c5 & Card.SUIT_MASK:
+            return HandEvaluator._flush_table[ ( ( c1 | c2 | c3 | c4 | c5 ) >> Card.RANK_BIT_SHIFT ) & Card.RANK_BITS_MASK ]
+
+        """
+        Five unique values: the hand is a straight or high card
+        """
+        strength = HandEvaluator._unique_table[ ( ( c1 | c2 | c3 | c4 | c5 ) >> Card.RANK_BIT_SHIFT ) & Card.RANK_BITS_MASK ]
+
+        if strength:
+            return strength
+
+        """
+        Repeated values: the product of the rank primes uniquely identifies the values in the hand
+        """
+        prime_mask  = Card.PRIME_MASK
+        product     = ( c1 & prime_mask ) * ( c2 & prime_mask ) * ( c3 & prime_mask ) * ( c4 & prime_mask ) * ( c5 & prime_mask )
+
+        return HandEvaluator._product_table.get(product, HandEvaluator.STRENGTH_UNKNOWN)
+
+    @staticmethod
+    def evaluate_best(cards):
+        """
+        Get the strength of the best 5-card hand that can be made from 5 to 7 cards
+        along with the 5 cards that make up that hand
+        """
+        strength    = HandEvaluator.STRENGTH_UNKNOWN
+        best_cards  = list()
+
+        if HandEvaluator.HAND_SIZE <= len(cards) <= HandEvaluator.MAX_CARDS:
+            strength    = HandEvaluator.evaluate_best_codes([ card.get_code() for card in cards ])
+            best_cards  = HandEvaluator._select_cards(cards, strength)
+
+        """
+        Return Result
+        """
+        return (strength, best_cards)
+
+    @staticmethod
+    def evaluate_best_codes(codes):
+        """
+        Get the strength of the best 5-card hand that can be made from 5 to 7 card codes
+
+        Sum the codes to count the cards of each suit: a counter of 5 or more means there is a flush
+        """
+        flush_bits = ( ( sum(codes) >> Card.SUIT_COUNTER_SHIFT ) + HandEvaluator.FLUSH_COUNTER_BIAS ) & HandEvaluator.FLUSH_COUNTER_MASK
+
+        if flush_bits:
+            """
+            Combine the rank bits of the flush suit only (no other hand can beat a flush made with 7 cards or less
+            except for a better flush)
+            """
+            flush_suit  = ( flush_bits.bit_length() - 1 ) // Card.SUIT_COUNTER_BITS
+            suit_bit    = 1 << ( Card.SUIT_SHIFT + flush_suit )
+            rank_bits   = 0
+
+            for code in codes:
+
+                if code & suit_bit:
+                    rank_bits |= code
+
+            return HandEvaluator._flush_best_table[ ( rank_bits >> Card.RANK_BIT_SHIFT ) & Card.RANK_BITS_MASK ]
+
+        """
+        No flush: the product of the rank primes identifies the values (and their counts) in the hand
+        """
+        prime_mask  = Card.PRIME_MASK
+        product     = 1
+
+        for code in codes:
+            product *= code & prime_mask
+
+        return HandEvaluator._rank_table.get(product, HandEvaluator.STRENGTH_UNKNOWN)
+
+    @staticmethod
+    def get_partial(codes):
+        """
+        Summarize a set of card codes so it can be combined with other sets without re-reading every card:
+        (product of rank primes, sum of codes, the codes themselves)
+        """
+        prime_mask  = Card.PRIME_MASK
+        product     = 1
+
+        for code in codes:
+            product *= code & prime_mask
+
+        return (product, sum(codes), tuple(codes))
+
+    @staticmethod
+    def combine_partials(first, second):
+        """
+        Combine the summaries of two disjoint sets of card codes
+        """
+        return (first[0] * second[0], first[1] + second[1], first[2] + second[2])
+
+    @staticmethod
+    def evaluate_partials(first, second):
+        """
+        Get the strength of the best hand that can be made from two disjoint summarized sets of 5 to 7 cards in total
+        Only a flush requires looking at the individual cards again
+        """
+        flush_bits = ( ( ( first[1] + second[1] ) >> Card.SUIT_COUNTER_SHIFT ) + HandEvaluator.FLUSH_COUNTER_BIAS ) & HandEvaluator.FLUSH_COUNTER_MASK
+
+        if flush_bits:
+            return HandEvaluator.evaluate_best_codes(first[2] + second[2])
+
+        return HandEvaluator._rank_table.get(first[0] * second[0], HandEvaluator.STRENGTH_UNKNOWN)
+
+    @staticmethod
+    def get_rank_table():
+        """
+        Get the table of non-flush strengths (product of the rank primes of 5 to 7 cards -> strength of the best hand)
+        so a loop that keeps its own products can look hands up without a method call per hand
+        """
+        return HandEvaluator._rank_table
+
+    @staticmethod
+    def get_ranking(strength):
+        """
+        Get the hand type and ordered hand values that a strength represents
+        """
+        return HandEvaluator._rankings[strength]
+
+    """
+    Private Methods
+    """
+    @staticmethod
+    def _select_cards(cards, strength):
+        """
+        Pick the 5 cards that make up the hand with the given strength from a larger set of cards
+        """
+        hand_type, values   = HandEvaluator.get_ranking(strength)
+        multiplicities      = HandEvaluator.VALUE_MULTIPLICITIES.get(hand_type, [ 1 ] * len(values))
+        available_cards     = list(cards)
+        best_cards          = list()
+
+        """
+        Flushes may only use cards of the flush suit
+        """
+        if hand_type in { HandEvaluator.TYPE_FLUSH, HandEvaluator.TYPE_STRAIGHT_FLUSH }:
+            suits           = [ card.get_suit() for card in cards ]
+            flush_suit      = max(set(suits), key=suits.count)
+            available_cards = [ card for card in cards if card.get_suit() == flush_suit ]
+
+        """
+        Take the required number of cards of each hand value
+        """
+        for value, multiplicity in zip(values, multiplicities):
+            value_cards = [ card for card in available_cards if card.get_value() == value ]
+            best_cards += value_cards[:multiplicity]
+
+        """
+        Return Result
+        """
+        return best_cards
+
+    """
+    Table Building Methods
+    """
+    @staticmethod
+    def _rank_values(values, flush):
+        """
+        Determine the hand type and ordered hand values of 5 card values (highest first)
+        """
+        value_counts    = Counter(values).most_common()
+        hand_values     = [ value for value, _ in sorted(value_counts, key=lambda value_freq: (value_freq[1], value_freq[0]), reverse=True) ]
+        frequencies     = sorted([ freq for _, freq in value_counts ], reverse=True)
+        hand_type       = HandEvaluator.TYPE_UNKNOWN
+
+        if len(hand_values) == HandEvaluator.HAND_SIZE:
+            """
+            All card values are unique: Hand must be Straight Flush, Straight, Flush, or High Card
+            """
+            straight = all( hand_values[i - 1] - hand_values[i] == 1 for i in range(1, len(hand_values)) )
+
+            """
+            Check for exception: A, 2, 3, 4, 5 (Ace is treated as a low value)
+            """
+            if not straight and hand_values == [ Card.ACE_HIGH_VALUE, 5, 4, 3, 2 ]:
+                hand_values = hand_values[1:] + [ Card.ACE_LOW_VALUE ]
+                straight    = True
+
+            if straight and flush:
+                hand_type = HandEvaluator.TYPE_STRAIGHT_FLUSH
+            elif straight:
+                hand_type = HandEvaluator.TYPE_STRAIGHT
+            elif flush:
+                hand_type = HandEvaluator.TYPE_FLUSH
+            else:
+                hand_type = HandEvaluator.TYPE_HIGH_CARD
+
+        else:
+            """
+            Repeated values: the frequency pattern determines the hand type
+            """
+            freq_to_type_table = {
+                (2, 1, 1, 1)    : HandEvaluator.TYPE_PAIR,
+                (2, 2, 1)       : HandEvaluator.TYPE_TWO_PAIR,
+                (3, 1, 1)       : HandEvaluator.TYPE_THREE_OF_A_KIND,
+                (3, 2)          : HandEvaluator.TYPE_FULL_HOUSE,
+                (4, 1)          : HandEvaluator.TYPE_FOUR_OF_A_KIND
+            }
+
+            hand_type = freq_to_type_table[ tuple(frequencies) ]
+
+        """
+        Return Result
+        """
+        return (hand_type, hand_values)
+
+    @staticmethod
+    def _exceeds_max_count(sorted_values):
+        """
+        Check if any value appears more times than there are suits (values must be sorted)
+        """
+        max_count = HandEvaluator.MAX_COUNT_PER_VALUE
+        return any( sorted_values[i] == sorted_values[i + max_count] for i in range(len(sorted_values) - max_count) )
+
+    @staticmethod
+    def _get_rank_bits(values):
+        """
+        Combine the rank bits of the given card values
+        """
+        rank_bits = 0
+
+        for value in values:
+            rank_bits |= 1 << ( value - Card.VALUES[0] )
+
+        return rank_bits
+
+    @staticmethod
+    def _get_prime_product(values):
+        """
+        Multiply the rank primes of the given card values
+        """
+        product = 1
+
+        for value in values:
+            product *= Card.RANK_PRIMES[ value - Card.VALUES[0] ]
+
+        return product
+
+    @staticmethod
+    def _build_tables():
+        """
+        Rank every multiset of values (flush and non-flush variants for unique values)
+        and assign strengths in ascending order of hand value
+        """
+        ranked_hands = list()
+
+        for values in combinations_with_replacement(reversed(Card.VALUES), HandEvaluator.HAND_SIZE):
+
+            if HandEvaluator._exceeds_max_count(values):
+                continue
+
+            is_unique = len(set(values)) == HandEvaluator.HAND_SIZE
+            ranked_hands.append( ( HandEvaluator._rank_values(values, False), values, False ) )
+
+            if is_unique:
+                ranked_hands.append( ( HandEvaluator._rank_values(values, True), values, True ) )
+
+        """
+        Sort by hand type, then by ordered values (the same order the hands are compared in)
+        Strength 0 is reserved for unknown hands
+        """
+        ranked_hands.sort(key=lambda ranked_hand: ranked_hand[0])
+
+        num_rank_patterns               = 1 << len(Card.VALUES)
+        HandEvaluator._flush_table      = [ HandEvaluator.STRENGTH_UNKNOWN ] * num_rank_patterns
+        HandEvaluator._unique_table     = [ HandEvaluator.STRENGTH_UNKNOWN ] * num_rank_patterns
+        HandEvaluator._product_table    = dict()
+        HandEvaluator._rankings         = [ ( HandEvaluator.TYPE_UNKNOWN, list() ) ]
+
+        for ranking, values, flush in ranked_hands:
+            strength = len(HandEvaluator._rankings)
+            HandEvaluator._rankings.append(ranking)
+
+            if flush:
+                HandEvaluator._flush_table[ HandEvaluator._get_rank_bits(values) ] = strength
+            elif len(set(values)) == HandEvaluator.HAND_SIZE:
+                HandEvaluator._unique_table[ HandEvaluator._get_rank_bits(values) ] = strength
+            else:
+                HandEvaluator._product_table[ HandEvaluator._get_prime_product(values) ] = strength
+
+            if not flush:
+                HandEvaluator._rank_table[ HandEvaluator._get_prime_product(values) ] = strength
+
+        """
+        Extend the tables to 6 and 7 cards: the best hand of N cards is the best hand left after removing any one card
+        """
+        HandEvaluator._flush_best_table = list(HandEvaluator._flush_table)
+
+        for num_cards in range(HandEvaluator.HAND_SIZE + 1, HandEvaluator.MAX_CARDS + 1):
+
+            for rank_idxs in combinations(range(len(Card.VALUES)), num_cards):
+                rank_bits = sum([ 1 << rank_idx for rank_idx in rank_idxs ])
+
+                HandEvaluator._flush_best_table[rank_bits] = max([ HandEvaluator._flush_best_table[ rank_bits & ~( 1 << rank_idx ) ] for rank_idx in rank_idxs ])
+
+            for values in combinations_with_replacement(Card.VALUES, num_cards):
+
+                if HandEvaluator._exceeds_max_count(values):
+                    continue
+
+                product = HandEvaluator._get_prime_product(values)
+
+                HandEvaluator._rank_table[product] = max([ HandEvaluator._rank_table[ product // Card.RANK_PRIMES[ value - Card.VALUES[0] ] ] for value in set(values) ])
+
+"""
+Build lookup tables once at import
+"""
+HandEvaluator._build_tables()
@@ -0,0 +1,203 @@
+"""
+HandHistory:
+    Read-only random access to the hands of a save file (see GameSave)
+    The file is memory-mapped and every record is checked (but not decoded) when it is opened, to build an index of
+    every hand (byte offset and size, round number, number of players before and after the hand)
+    A hand is only decoded when it is accessed, so jumping to any hand or checking if the game is complete
+    does not depend on the length of the history
+
+    Hands can be accessed by index (negative indices count from the end) or iterated over in order,
+    so a hand history can be used in place of a list of hands
+    Iterating streams the hands (one decoded hand at a time), optionally filtered by player, round numbers, or showdowns
+    Only journals can be read (older saves are loaded with GameSave)
+"""
+
+"""
+Imports
+"""
+from mmap       import ACCESS_READ, mmap
+from os         import fstat
+from pickle     import loads
+from zlib       import crc32
+
+from gamemove   import GameMove
+from gamesave   import GameSave
+from handrecord import HandRecord
+
+class HandHistory:
+    """
+    Constants
+    """
+    EXCEPTION_BAD_CHECKSUM  = "Hand %d of the save file is corrupt"
+    EXCEPTION_NOT_JOURNAL   = "%s is not a journal"
+
+    """
+    Constructor
+    """
+    def __init__(self, save_name):
+        """
+        Properties
+        """
+        self._file      = open("%s%s" % (save_name, GameSave.GAME_SAVE_FILE_EXT), GameSave.FILE_READ_CODE)  ### Open save file
+        self._data      = None      ### Memory map of the save file (None if the file is empty)
+        self._setup     = None      ### Game setup data
+        self._index     = list()    ### (data offset, data size, checksum, round number, number of players before and after) of each hand
+
+        """
+        An empty file cannot be mapped and holds no hands
+        """
+        if fstat(self._file.fileno()).st_size == 0:
+            return
+
+        self._data = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+
+        if not GameSave.is_journal(self._data):
+            self.close()
+            raise Exception(HandHistory.EXCEPTION_NOT_JOURNAL % save_name)
+
+        self._build_index()
+
+    """
+    Static Methods
+    """
+    @staticmethod
+    def went_to_showdown(hand):
+        """
+        Check if a hand went to showdown (at least two of the players dealt in did not fold)
+        """
+        _, player_state_init, _, actions, _, _, _ = hand
+        num_folds = len([ move for _, move, _ in actions if move == GameMove.FOLD ])
+
+        """
+        Return Result
+        """
+        return len(player_state_init) - num_folds > 1
+
+    """
+    Overrides
+    """
+    def __len__(self):
+        return len(self._index)
+
+    def __getitem__(self, hand_idx):
+        return self.get_hand(hand_idx)
+
+    def __iter__(self):
+        return self.iter_hands()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    """
+    Getter Methods
+    """
+    def get_setup(self):
+        return self._setup
+
+    def get_num_hands(self):
+        return len(self._index)
+
+    def get_round_number(self, hand_idx):
+        """
+        Get the round number of a hand (from the index, without decoding the hand)
+        """
+        return self._index[hand_idx][3]
+
+    def get_num_players(self, hand_idx):
+        """
+        Get the number of players before and after a hand (from the index, without decoding the hand)
+        """
+        _, _, _, _, num_players_init, num_players_final = self._index[hand_idx]
+        return (num_players_init, num_players_final)
+
+    def get_hand(self, hand_idx):
+        """
+        Decode a single hand
+        """
+        if hand_idx < 0:
+            hand_idx += len(self._index)
+
+        data_offset, data_size, checksum, _, _, _ = self._index[hand_idx]
+        data = self._data[ data_offset : data_offset + data_size ]
+
+        if crc32(data) != checksum:
+            raise Exception(HandHistory.EXCEPTION_BAD_CHECKSUM % hand_idx)
+
+        """
+        Return Result
+        """
+        return HandRecord.decode(data)
+
+    def is_game_complete(self):
+        """
+        Check if only one player is left after the most recent hand (see GameSave.is_game_complete)
+        """
+        return len(self._index) > 0 and self.get_num_players(-1)[1] == 1
+
+    """
+    Public Methods
+    """
+    def iter_hands(self, player_id=None, first_round=None, last_round=None, showdown_only=False):
+        """
+        Yield every hand that matches all of the given filters in order, decoding one hand at a time
+        The round numbers are checked from the index, so hands outside of the round range are never decoded
+        parameter player_id:        Only yield hands the player with this ID was dealt into
+        parameter first_round:      Only yield hands from this round number on
+        parameter last_round:       Only yield hands up to this round number
+        parameter showdown_only:    Only yield hands that went to showdown
+        """
+        for hand_idx in range(len(self._index)):
+            round_number = self.get_round_number(hand_idx)
+
+            if ( first_round is not None and round_number < first_round ) or ( last_round is not None and round_number > last_round ):
+                continue
+
+            hand                                = self.get_hand(hand_idx)
+            _, player_state_init, _, _, _, _, _ = hand
+
+            if player_id is not None and player_id not in [ player.ID for player in player_state_init ]:
+                continue
+
+            if showdown_only and not HandHistory.went_to_showdown(hand):
+                continue
+
+            yield hand
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+
+        self._file.close()
+
+    """
+    Private Methods
+    """
+    def _build_index(self):
+        """
+        Walk the records: the first record is the setup and every other record is a hand
+        A record running past the end of the file (torn by a crash) or failing its checksum ends the history
+        (each checksum is verified before anything else is read from the record)
+        """
+        offset          = GameSave.RECORDS_OFFSET
+        file_size       = len(self._data)
+        header_size     = GameSave.RECORD_HEADER.size
+        setup_record    = True
+
+        while offset + header_size <= file_size:
+            data_size, checksum = GameSave.RECORD_HEADER.unpack_from(self._data, offset)
+            data_offset         = offset + header_size
+
+            if data_offset + data_size > file_size or crc32(self._data[ data_offset : data_offset + data_size ]) != checksum:
+                break
+
+            if setup_record:
+                self._setup     = loads(self._data[ data_offset : data_offset + data_size ])
+                setup_record    = False
+            else:
+                round_number, num_players_init, num_players_final, _ = HandRecord.get_summary(self._data, data_offset)
+                self._index.append(( data_offset, data_size, checksum, round_number, num_players_init, num_players_final ))
+
+            offset = data_offset + data_size
@@ -0,0 +1,252 @@
+"""
+HandRecord:
+    Compact binary encoding of one saved hand (see GameSave)
+    A hand is (round number, player state before the hand, blind timestamp before the hand, actions, board cards,
+    player state after the hand, blind timestamp after the hand) and is encoded as:
+        * A header: format version, number format flags, round number, both timestamps,
+          and the number of players in each state, actions, and board cards
+        * Each player state as arrays of player IDs, stacks, actions, and hole cards (one byte per card index)
+        * Each action as a packed (player ID, move, amount) struct
+        * The board cards (one byte per card index)
+    Chip counts are stored as 32-bit integers when every chip count in the hand is a whole number (doubles otherwise),
+    a chip array that is all zeros (e.g. the actions after a hand) is left out, and player IDs take one byte when they fit
+    Player states are decoded as PlayerViews and cards as the shared Card instances
+"""
+
+"""
+Imports
+"""
+from math       import isnan
+from struct     import Struct
+
+from card       import Card
+from playerview import PlayerView
+
+class HandRecord:
+    """
+    Constants
+    """
+    FORMAT_VERSION  = 1                     ### Version of the encoding written by encode
+    NUM_HOLE_CARDS  = 2                     ### Number of hole card slots stored for each player
+    NO_CARD         = 0xFF                  ### Byte of an empty hole card slot
+
+    FLAG_WHOLE_CHIPS    = 0x01              ### Chip counts are stored as 32-bit integers (as doubles otherwise)
+    FLAG_SMALL_IDS      = 0x02              ### Player IDs are stored in one byte (in four otherwise)
+    FLAG_NO_ACTIONS_IN  = 0x04              ### Every player's action before the hand is 0 (the array is left out)
+    FLAG_NO_ACTIONS_OUT = 0x08              ### Every player's action after the hand is 0 (the array is left out)
+
+    HEADER          = Struct("<BBIddBBHB")  ### Version, flags, round number, initial and final timestamps, number of initial and final players, actions, and board cards
+    WHOLE_ACTION    = Struct("<IBi")        ### Player ID, move, amount (whole chips, NO_WHOLE_AMOUNT if there is none)
+    SPLIT_ACTION    = Struct("<IBd")        ### Player ID, move, amount (fractional chips, NaN if there is none)
+    NO_WHOLE_AMOUNT = -1                    ### Stored whole-chip amount of an action without one
+    NO_TIMESTAMP    = float("nan")          ### Stored timestamp if there is none
+    MAX_WHOLE_CHIPS = 2 ** 31 - 1           ### Largest chip count that fits a 32-bit integer
+    MAX_SMALL_ID    = 0xFF                  ### Largest player ID that fits one byte
+
+    EXCEPTION_UNKNOWN_VERSION = "Unrecognized hand record version [%d]"
+
+    """
+    Static Methods
+    """
+    @staticmethod
+    def encode(hand):
+        """
+        Encode a hand as bytes
+        """
+        round_number, player_state_init, timestamp_init, actions, cards, player_state_final, timestamp_final = hand
+
+        """
+        Choose the number formats that fit every value in the hand
+        """
+        players     = list(player_state_init) + list(player_state_final)
+        chip_counts = [ player.get_stack_size() for player in players ] + [ player.get_action() for player in players ] + [ amount for _, _, amount in actions if amount is not None ]
+        flags       = 0
+
+        if all([ float(chips).is_integer() and 0 <= chips <= HandRecord.MAX_WHOLE_CHIPS for chips in chip_counts ]):
+            flags |= HandRecord.FLAG_WHOLE_CHIPS
+
+        if all([ player.ID <= HandRecord.MAX_SMALL_ID for player in players ]):
+            flags |= HandRecord.FLAG_SMALL_IDS
+
+        if all([ player.get_action() == 0 for player in player_state_init ]):
+            flags |= HandRecord.FLAG_NO_ACTIONS_IN
+
+        if all([ player.get_action() == 0 for player in player_state_final ]):
+            flags |= HandRecord.FLAG_NO_ACTIONS_OUT
+
+        """
+        Pack every part of the hand
+        """
+        header = HandRecord.HEADER.pack(
+            HandRecord.FORMAT_VERSION,
+            flags,
+            round_number,
+            timestamp_init if timestamp_init is not None else HandRecord.NO_TIMESTAMP,
+            timestamp_final if timestamp_final is not None else HandRecord.NO_TIMESTAMP,
+            len(player_state_init),
+            len(player_state_final),
+            len(actions),
+            len(cards)
+        )
+
+        if flags & HandRecord.FLAG_WHOLE_CHIPS:
+            action_data = [ HandRecord.WHOLE_ACTION.pack(player_id, move, int(amount) if amount is not None else HandRecord.NO_WHOLE_AMOUNT) for player_id, move, amount in actions ]
+        else:
+            action_data = [ HandRecord.SPLIT_ACTION.pack(player_id, move, amount if amount is not None else float("nan")) for player_id, move, amount in actions ]
+
+        """
+        Return Result
+        """
+        return b"".join([
+            header,
+            HandRecord._encode_players(player_state_init,   flags, not flags & HandRecord.FLAG_NO_ACTIONS_IN),
+            HandRecord._encode_players(player_state_final,  flags, not flags & HandRecord.FLAG_NO_ACTIONS_OUT),
+            b"".join(action_data),
+            bytes([ card.get_index() for card in cards ])
+        ])
+
+    @staticmethod
+    def decode(data):
+        """
+        Decode a hand from bytes written by encode
+        """
+        HandRecord._check_version(data)
+
+        _, flags, round_number, timestamp_init, timestamp_final, num_players_init, num_players_final, num_actions, num_cards = HandRecord.HEADER.unpack_from(data)
+        offset = HandRecord.HEADER.size
+
+        """
+        Player states
+        """
+        player_state_init,  offset = HandRecord._decode_players(data, offset, num_players_init,     flags, not flags & HandRecord.FLAG_NO_ACTIONS_IN)
+        player_state_final, offset = HandRecord._decode_players(data, offset, num_players_final,    flags, not flags & HandRecord.FLAG_NO_ACTIONS_OUT)
+
+        """
+        Actions
+        """
+        actions = list()
+
+        if flags & HandRecord.FLAG_WHOLE_CHIPS:
+            action_struct = HandRecord.WHOLE_ACTION
+
+            for player_id, move, amount in action_struct.iter_unpack(data[ offset : offset + num_actions * action_struct.size ]):
+                actions.append(( player_id, move, amount if amount != HandRecord.NO_WHOLE_AMOUNT else None ))
+        else:
+            action_struct = HandRecord.SPLIT_ACTION
+
+            for player_id, move, amount in action_struct.iter_unpack(data[ offset : offset + num_actions * action_struct.size ]):
+                actions.append(( player_id, move, amount if not isnan(amount) else None ))
+
+        offset += num_actions * action_struct.size
+
+        """
+        Board cards
+        """
+        cards = [ Card.DECK[card_idx] for card_idx in data[ offset : offset + num_cards ] ]
+
+        """
+        Return Result
+        """
+        return (
+            round_number,
+            player_state_init,
+            timestamp_init if not isnan(timestamp_init) else None,
+            actions,
+            cards,
+            player_state_final,
+            timestamp_final if not isnan(timestamp_final) else None
+        )
+
+    @staticmethod
+    def get_summary(data, offset=0):
+        """
+        Get the (round number, number of players before the hand, number of players after the hand, timestamp after the hand)
+        of an encoded hand at the given offset of a buffer without decoding it
+        """
+        HandRecord._check_version(data, offset=offset)
+
+        _, _, round_number, _, timestamp_final, num_players_init, num_players_final, _, _ = HandRecord.HEADER.unpack_from(data, offset)
+        return (round_number, num_players_init, num_players_final, timestamp_final if not isnan(timestamp_final) else None)
+
+    @staticmethod
+    def get_num_final_players(data):
+        """
+        Get the number of players left after an encoded hand without decoding it
+        """
+        _, _, num_players_final, _ = HandRecord.get_summary(data)
+        return num_players_final
+
+    @staticmethod
+    def _check_version(data, offset=0):
+        if data[offset] != HandRecord.FORMAT_VERSION:
+            raise Exception(HandRecord.EXCEPTION_UNKNOWN_VERSION % data[offset])
+
+    @staticmethod
+    def _get_array_formats(flags, num_players):
+        """
+        Get the structs of the player ID and chip count arrays of a player state
+        """
+        id_format   = "<%dB" if flags & HandRecord.FLAG_SMALL_IDS else "<%dI"
+        chip_format = "<%di" if flags & HandRecord.FLAG_WHOLE_CHIPS else "<%dd"
+
+        return ( Struct(id_format % num_players), Struct(chip_format % num_players) )
+
+    @staticmethod
+    def _encode_players(players, flags, include_actions):
+        """
+        Encode the state of each player as arrays of IDs, stacks, actions (if included), and hole cards
+        """
+        ids_struct, chips_struct    = HandRecord._get_array_formats(flags, len(players))
+        to_chips                    = int if flags & HandRecord.FLAG_WHOLE_CHIPS else float
+        hole_cards                  = list()
+
+        for player in players:
+            player_cards    = [ card.get_index() for card in player.get_hole_cards() ]
+            hole_cards      += player_cards + [ HandRecord.NO_CARD ] * ( HandRecord.NUM_HOLE_CARDS - len(player_cards) )
+
+        player_arrays = [
+            ids_struct.pack(*[ player.ID for player in players ]),
+            chips_struct.pack(*[ to_chips(player.get_stack_size()) for player in players ])
+        ]
+
+        if include_actions:
+            player_arrays.append(chips_struct.pack(*[ to_chips(player.get_action()) for player in players ]))
+
+        """
+        Return Result
+        """
+        return b"".join(player_arrays + [ bytes(hole_cards) ])
+
+    @staticmethod
+    def _decode_players(data, offset, num_players, flags, include_actions):
+        """
+        Decode the state of each player as PlayerViews
+        Return the player views and the offset after the player states
+        """
+        ids_struct, chips_struct = HandRecord._get_array_formats(flags, num_players)
+
+        player_ids  = ids_struct.unpack_from(data, offset)
+        offset      += ids_struct.size
+        stacks      = chips_struct.unpack_from(data, offset)
+        offset      += chips_struct.size
+        actions     = ( 0, ) * num_players
+
+        if include_actions:
+            actions = chips_struct.unpack_from(data, offset)
+            offset  += chips_struct.size
+
+        hole_cards  = data[ offset : offset + num_players * HandRecord.NUM_HOLE_CARDS ]
+        offset      += num_players * HandRecord.NUM_HOLE_CARDS
+
+        players = list()
+
+        for player_num in range(num_players):
+            card_slots      = hole_cards[ player_num * HandRecord.NUM_HOLE_CARDS : ( player_num + 1 ) * HandRecord.NUM_HOLE_CARDS ]
+            player_cards    = [ Card.DECK[card_idx] for card_idx in card_slots if card_idx != HandRecord.NO_CARD ]
+
+            players.append(PlayerView(player_ids[player_num], stacks[player_num], actions[player_num], player_cards))
+
+        """
+        Return Result
+        """
+        return (players, offset)
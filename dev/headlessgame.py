@@ -0,0 +1,163 @@
+"""
+HeadlessGame:
+    Runs a complete game without a user for self-play and bot evaluation
+    Every move is chosen by the agent at each seat (a decision function is treated as a CallbackAgent),
+    nothing is printed, no hot key listener or blind timer thread is started, and nothing waits for an acknowledgement
+
+    Blinds are raised after a set number of hands instead of after a set amount of time,
+    or follow the game setup's blind interval on a virtual clock that advances a set number of seconds per hand and per action
+"""
+
+"""
+Imports
+"""
+from blindschedule  import BlindSchedule
+from callbackagent  import CallbackAgent
+from game           import Game
+from gamesave       import GameSave
+from headlessui     import HeadlessUI
+from pokeragent     import PokerAgent
+from virtualclock   import VirtualClock
+
+class HeadlessGame(Game):
+    """
+    Constants
+    """
+    GAME_SAVE_NAME = "headless"    ### Name of the in-memory game save that records the hand history (it is never written)
+    SEAT_HUMANS    = False         ### Every seat must be given an agent (nothing can be prompted)
+
+    EXCEPTION_NUM_AGENTS = "Expected an agent for each of the %d seats but got %d"
+
+    """
+    Constructor
+    """
+    def __init__(self, game_setup, agents, hands_per_level=None, max_hands=None, decision_time_limit=Game.DEFAULT_DECISION_TIME_LIMIT, seconds_per_hand=None, seconds_per_action=None):
+        """
+        Use a virtual clock if the blinds should follow the blind interval in simulated time
+        """
+        clock = VirtualClock() if seconds_per_hand is not None or seconds_per_action is not None else None
+
+        """
+        Properties
+        """
+        super().__init__(ui=HeadlessUI(), decision_time_limit=decision_time_limit, clock=clock)
+
+        if len(agents) != game_setup.starting_num_players:
+            raise Exception(HeadlessGame.EXCEPTION_NUM_AGENTS % (game_setup.starting_num_players, len(agents)))
+
+        self.seat_agents([ agent if isinstance(agent, PokerAgent) else CallbackAgent(agent) for agent in agents ])
+
+        self._clock                 = clock                     ### Virtual clock of the blind timer (None if blinds are raised by hand count)
+        self._game_setup            = game_setup                ### Setup of the game to play
+        self._hands_per_level       = hands_per_level           ### Number of hands played between blind increases (None to never raise the blinds, ignored with a virtual clock)
+        self._max_hands             = max_hands                 ### Number of hands to play before stopping an unfinished game (None for no limit)
+        self._num_hands_played      = 0                         ### Number of hands played so far
+        self._seconds_per_action    = seconds_per_action or 0   ### Virtual seconds that pass with each move
+        self._seconds_per_hand      = seconds_per_hand or 0     ### Virtual seconds that pass with each hand
+        self._winner                = None                      ### Copy of the winning player once the game is over
+
+    """
+    Getter Methods
+    """
+    def get_winner(self):
+        return self._winner
+
+    def get_eliminations(self):
+        """
+        Get the (player ID, final rank) of each eliminated player in the order they were eliminated
+        """
+        return self._ui.get_eliminations()
+
+    def get_num_hands_played(self):
+        return self._num_hands_played
+
+    def get_game_save(self):
+        """
+        Get the recorded setup and hand history
+        """
+        return self._game_save
+
+    """
+    Public Methods
+    """
+    def setup(self):
+        """
+        Set up the game data from the game setup (no prompts) and seat the players
+        The blinds follow the game's default increase scheme unless the setup has its own
+        """
+        self._game_save                         = GameSave(HeadlessGame.GAME_SAVE_NAME)
+        self._num_remaining_players             = self._game_setup.starting_num_players
+        self._game_setup.handle_time_expired    = self._handle_time_expired
+
+        if self._game_setup.blind_increase_scheme is None:
+            self._game_setup.blind_increase_scheme = Game.DEFAULT_BLIND_RAISING_SCHEME
+
+        self._game_data.setup_game_data(self._game_setup)
+        self._game_setup.button_positions = self._game_data.get_button_positions()
+        self._game_save.snap_game_setup(self._game_setup)
+
+    def play_game(self):
+        """
+        Play hands until there is a winner or the hand limit is reached
+        Return the winning player (None if the game did not finish)
+        """
+        self._assign_seats()
+        self._game_data.mark_next_round()
+
+        try:
+            while self._winner is None and ( self._max_hands is None or self._num_hands_played < self._max_hands ):
+                self._setup_hand()
+                self._play_hand()
+                self._winner            = self._cleanup_hand()
+                self._num_hands_played  += 1
+
+                if self._clock is not None:
+                    self._clock.advance(self._seconds_per_hand)
+        finally:
+            self._close_agent_worker()
+
+        if self._winner is not None:
+            self._ui.display_winner(self._winner)
+
+        """
+        Return Result
+        """
+        return self._winner
+
+    """
+    Private Methods
+    """
+    def _choose_move(self, player_idx, player, available_moves, action_to_play, preflop=False):
+        """
+        Let the virtual time of a move pass after it is chosen
+        """
+        chosen_move = super()._choose_move(player_idx, player, available_moves, action_to_play, preflop=preflop)
+
+        if self._clock is not None:
+            self._clock.advance(self._seconds_per_action)
+
+        """
+        Return Result
+        """
+        return chosen_move
+
+    def _manage_timer(self):
+        """
+        With a virtual clock, the blind timer runs as in a regular game
+        Otherwise, raise the blinds once the number of hands played reaches the next level of the schedule (until they are maxed out)
+        There is no blind timer, so the remaining time is always 0
+        """
+        if self._clock is not None:
+            return super()._manage_timer()
+
+        new_level = self._hands_per_level and BlindSchedule.get_round_number_at(self._num_hands_played, self._hands_per_level) > self._game_data.get_round_number()
+
+        if new_level and not self._blinds_maxed_out:
+            self._game_data.mark_next_round()
+            self._game_data.raise_blinds()
+            self._blinds_maxed_out = self._game_data.blinds_maxed_out()
+
+        """
+        Return Result (remaining time)
+        """
+        return 0
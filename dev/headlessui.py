@@ -0,0 +1,90 @@
+"""
+HeadlessUI:
+    Silent stand-in for GameUI used to run games without a user
+    Nothing is displayed and nothing waits for an acknowledgement
+    There is no one to prompt, so every seat must be played by an agent
+"""
+
+class HeadlessUI:
+    """
+    Constants
+    """
+    EXCEPTION_NO_HUMAN = "%s has no agent and there is no user to prompt for a move"
+
+    """
+    Constructor
+    """
+    def __init__(self):
+        """
+        Properties
+        """
+        self._eliminations  = list()    ### (player ID, final rank) of each eliminated player in order
+
+    """
+    Getter Methods
+    """
+    def get_eliminations(self):
+        return list(self._eliminations)
+
+    """
+    Public Methods
+    """
+    def prompt_available_moves(self, player, moves, action_to_play):
+        raise Exception(HeadlessUI.EXCEPTION_NO_HUMAN % player)
+
+    def display_player_eliminated(self, player, rank):
+        """
+        Record the player's final rank instead of displaying it
+        """
+        self._eliminations.append((player.ID, rank))
+
+    """
+    Silent Display Methods (nothing is shown and no acknowledgement is needed)
+    """
+    def setup_save_command(self, callback):
+        pass
+
+    def listen_for_hot_keys(self):
+        pass
+
+    def display_time_expired(self):
+        pass
+
+    def display_timer_set(self, round_num, blind_amt, time_amt, past=False):
+        pass
+
+    def display_current_timer_value(self, round_num, timer_value):
+        pass
+
+    def display_blinds_maxed_out(self, amount):
+        pass
+
+    def display_player_data(self, players, notable_positions):
+        pass
+
+    def display_pot(self, pot):
+        pass
+
+    def display_move_made(self, player, chosen_move, chosen_amount):
+        pass
+
+    def display_no_moves_available(self, player):
+        pass
+
+    def display_no_bet_from_all_in(self):
+        pass
+
+    def display_showdown_results(self, player_hand_triples, num_winners, pot_idx=0, display_multiple_pots=False):
+        pass
+
+    def display_folded_round(self, player, show_hand, pot_idx=-1):
+        pass
+
+    def display_round_border(self):
+        pass
+
+    def display_board(self, board_cards, board_name_idx=-1):
+        pass
+
+    def display_winner(self, winner):
+        pass
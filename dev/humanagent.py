@@ -0,0 +1,30 @@
+"""
+HumanAgent:
+    Seats a human at the terminal: every move is prompted through the game's user interface
+"""
+
+"""
+Imports
+"""
+from pokeragent import PokerAgent
+
+class HumanAgent(PokerAgent):
+    """
+    Constants
+    """
+    TIME_LIMITED = False    ### A human may take as long as needed
+
+    """
+    Constructor
+    """
+    def __init__(self, ui):
+        """
+        Properties
+        """
+        self._ui = ui   ### User interface used to prompt for moves
+
+    """
+    Public Methods
+    """
+    def choose_move(self, view, available_moves, action_to_play):
+        return self._ui.prompt_available_moves(view.get_player(), available_moves, action_to_play)
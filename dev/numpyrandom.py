@@ -0,0 +1,69 @@
+"""
+NumpyRandom:
+    Adapts a NumPy Generator to the standard random.Random interface so the game can draw from it
+    The underlying Generator is exposed for batch sampling (NumPy is only required if this generator is used)
+"""
+
+"""
+Imports
+"""
+from random import Random
+
+import numpy
+
+class NumpyRandom(Random):
+    """
+    Constants
+    """
+    WORD_BITS = 64
+
+    """
+    Constructor
+    """
+    def __init__(self, seed=None):
+        """
+        Properties
+        """
+        self._generator = None  ### Wrapped NumPy Generator
+
+        super().__init__(seed)
+
+    """
+    Random Overrides
+    """
+    def seed(self, a=None, version=2):
+        """
+        Create a new Generator from the seed (non-integer seeds are reduced to an integer first)
+        """
+        if a is not None and not isinstance(a, int):
+            a = Random(a).getrandbits(NumpyRandom.WORD_BITS)
+
+        self._generator = numpy.random.default_rng(a)
+
+    def random(self):
+        return float( self._generator.random() )
+
+    def getrandbits(self, k):
+        """
+        Get an integer with k random bits from as many 64-bit words as needed
+        """
+        result      = 0
+        num_bits    = 0
+
+        while num_bits < k:
+            result      |= int( self._generator.integers(0, 1 << NumpyRandom.WORD_BITS, dtype=numpy.uint64) ) << num_bits
+            num_bits    += NumpyRandom.WORD_BITS
+
+        return result & ( ( 1 << k ) - 1 )
+
+    def getstate(self):
+        return self._generator.bit_generator.state
+
+    def setstate(self, state):
+        self._generator.bit_generator.state = state
+
+    """
+    Getter Methods
+    """
+    def get_generator(self):
+        return self._generator
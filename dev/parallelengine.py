@@ -0,0 +1,267 @@
+"""
+ParallelEngine:
+    Splits equity calculations and simulated games into tasks that run on a pool of worker processes
+
+    Every task gets its own seed derived from the engine's seed and the task's number,
+    so a run with a fixed sample budget gives the same result no matter how the tasks are scheduled
+    Worker processes build the hand evaluator's lookup tables once, when they start, and reuse them for every task
+"""
+
+"""
+Imports
+"""
+from concurrent.futures     import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from os                     import cpu_count
+from threading              import Event
+from time                   import perf_counter
+
+from card                   import Card
+from equitycalculator       import EquityCalculator
+from equityresult           import EquityResult
+from gamerandom             import GameRandom
+
+class ParallelEngine:
+    """
+    Constants
+    """
+    DEFAULT_CHUNK_SIZE  = 5000  ### Number of Monte Carlo trials in one task
+    TASKS_PER_WORKER    = 2     ### Number of tasks queued for each worker so no worker sits idle between tasks
+    POLL_INTERVAL       = 0.05  ### Number of seconds between checks for cancellation while waiting on tasks
+
+    """
+    Worker Process State
+    """
+    _worker_calculator  = None  ### Equity calculator of the current worker process (reseeded for every task)
+
+    """
+    Constructor
+    """
+    def __init__(self, num_workers=None, seed=None, rng_kind=GameRandom.KIND_MERSENNE, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Properties
+        """
+        self._num_workers   = num_workers if num_workers is not None else cpu_count() or 1      ### Number of worker processes
+        self._seed          = seed if seed is not None else GameRandom.new_seed()               ### Seed every task seed is derived from
+        self._rng_kind      = rng_kind                                                          ### Kind of random number generator used by the workers
+        self._chunk_size    = chunk_size                                                        ### Number of Monte Carlo trials in one task
+        self._executor      = None                                                              ### Pool of worker processes (started on first use)
+        self._cancel_event  = Event()                                                           ### Set to stop submitting tasks
+        self._num_tasks     = 0                                                                 ### Number of tasks submitted so far
+
+    """
+    Context Manager Overrides
+    """
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    """
+    Getter Methods
+    """
+    def get_num_workers(self):
+        return self._num_workers
+
+    def get_seed(self):
+        return self._seed
+
+    """
+    Public Methods
+    """
+    def start(self):
+        """
+        Start the worker processes (does nothing if they are already running)
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers = self._num_workers,
+                initializer = ParallelEngine._initialize_worker,
+                initargs    = (self._rng_kind,)
+            )
+
+    def shutdown(self):
+        """
+        Stop the worker processes, dropping any tasks that have not started
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def cancel(self):
+        """
+        Stop the current run (safe to call from another thread)
+        Tasks that have not started are dropped and tasks that are already running are allowed to finish
+        """
+        self._cancel_event.set()
+
+    def calculate_equity(self, hole_cards, board=list(), dead_cards=list(), num_opponents=1, num_samples=None, time_budget=None):
+        """
+        Estimate the equity of the hole cards with Monte Carlo trials split across the workers
+        Sampling stops after the sample budget is used or the time budget (in seconds) has passed, whichever is first
+        """
+        if num_samples is None and time_budget is None:
+            num_samples = EquityCalculator.DEFAULT_NUM_SAMPLES
+
+        deadline    = perf_counter() + time_budget if time_budget is not None else None
+        result      = EquityResult()
+
+        def get_tasks():
+            """
+            Split the sample budget into chunks (chunks never run out if there is only a time budget)
+            """
+            num_submitted = 0
+
+            while num_samples is None or num_submitted < num_samples:
+                chunk_size      = self._chunk_size if num_samples is None else min(self._chunk_size, num_samples - num_submitted)
+                num_submitted   += chunk_size
+                task_budget     = deadline - perf_counter() if deadline is not None else None
+
+                yield (self._next_task_seed(), list(hole_cards), list(board), list(dead_cards), num_opponents, chunk_size, task_budget)
+
+        for chunk_result in self._run_tasks(ParallelEngine._run_equity_task, get_tasks(), deadline):
+            result.merge(chunk_result)
+
+        """
+        Return Result
+        """
+        return result
+
+    def calculate_exact_equity(self, hole_cards, board=list(), dead_cards=list(), opponent_hands=None):
+        """
+        Calculate the exact equity of the hole cards with the runouts split across the workers by their first card
+        The parts with the most runouts are submitted first so the workers finish at about the same time
+        """
+        known_cards = set(hole_cards) | set(board) | set(dead_cards)
+
+        for opponent_hand in opponent_hands or list():
+            known_cards |= set(opponent_hand)
+
+        remaining_cards = [ card for card in Card.DECK if card not in known_cards ]
+        num_board_cards = EquityCalculator.BOARD_SIZE - len(board)
+        first_cards     = remaining_cards[:len(remaining_cards) - num_board_cards + 1] if num_board_cards > 0 else [ None ]
+        tasks           = [ (list(hole_cards), list(board), list(dead_cards), opponent_hands, first_card) for first_card in first_cards ]
+        result          = EquityResult(exact=True)
+
+        for part_result in self._run_tasks(ParallelEngine._run_exact_task, tasks):
+            result.merge(part_result)
+
+        """
+        Return Result
+        """
+        return result
+
+    def run_simulations(self, simulate, num_games, args=tuple(), time_budget=None):
+        """
+        Run a number of simulated games across the workers
+        The simulation is called as simulate(seed, *args) and must be a module-level function so it can be sent to the workers
+        Return each game's result by game number (None for games that were not run before the time budget passed or the run was cancelled)
+        """
+        deadline    = perf_counter() + time_budget if time_budget is not None else None
+        results     = [ None ] * num_games
+        tasks       = ( (simulate, game_idx, self._next_task_seed(), tuple(args)) for game_idx in range(num_games) )
+
+        for game_idx, game_result in self._run_tasks(ParallelEngine._run_simulation_task, tasks, deadline):
+            results[game_idx] = game_result
+
+        """
+        Return Result
+        """
+        return results
+
+    """
+    Private Methods
+    """
+    def _next_task_seed(self):
+        """
+        Derive the seed of the next task from the engine's seed
+        """
+        seed            = GameRandom.derive_seed(self._seed, self._num_tasks)
+        self._num_tasks += 1
+
+        return seed
+
+    def _run_tasks(self, function, tasks, deadline=None):
+        """
+        Submit tasks to the workers a few at a time and generate each task's result as it completes
+        No new tasks are submitted after the deadline passes or the run is cancelled
+        """
+        self.start()
+        self._cancel_event.clear()
+
+        tasks       = iter(tasks)
+        max_pending = self._num_workers * ParallelEngine.TASKS_PER_WORKER
+        pending     = set()
+        stopping    = False
+
+        try:
+            while True:
+                """
+                Keep every worker busy until there are no tasks left or the run stops
+                """
+                stopping = stopping or self._cancel_event.is_set() or ( deadline is not None and perf_counter() >= deadline )
+
+                while not stopping and len(pending) < max_pending:
+                    task_args = next(tasks, None)
+
+                    if task_args is None:
+                        break
+
+                    pending.add( self._executor.submit(function, *task_args) )
+
+                if stopping:
+                    pending = { future for future in pending if not future.cancel() }
+
+                if len(pending) == 0:
+                    break
+
+                """
+                Wait for a task to complete
+                """
+                done, pending = wait(pending, timeout=ParallelEngine.POLL_INTERVAL, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    yield future.result()
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+    """
+    Worker Methods
+    """
+    @staticmethod
+    def _initialize_worker(rng_kind):
+        """
+        Prepare a worker process: importing this module has already built the hand evaluator's lookup tables,
+        so only the worker's equity calculator is left to create
+        """
+        ParallelEngine._worker_calculator = EquityCalculator( GameRandom.create(kind=rng_kind) )
+
+    @staticmethod
+    def _run_equity_task(seed, hole_cards, board, dead_cards, num_opponents, num_samples, time_budget):
+        """
+        Run a chunk of Monte Carlo trials with the worker's equity calculator reseeded for this task
+        """
+        calculator = ParallelEngine._worker_calculator
+        calculator.seed(seed)
+
+        if time_budget is not None and time_budget <= 0:
+            return EquityResult()
+
+        return calculator.calculate(hole_cards, board, dead_cards, num_opponents, num_samples, time_budget)
+
+    @staticmethod
+    def _run_exact_task(hole_cards, board, dead_cards, opponent_hands, first_card):
+        """
+        Enumerate the runouts starting with one card
+        """
+        return ParallelEngine._worker_calculator.calculate_exact(hole_cards, board, dead_cards, opponent_hands, first_card)
+
+    @staticmethod
+    def _run_simulation_task(simulate, game_idx, seed, args):
+        """
+        Run one simulated game and tag its result with the game number
+        """
+        return (game_idx, simulate(seed, *args))
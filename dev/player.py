@@ -3,12 +3,12 @@ Player:
     Represents a player in the game and all data pertaining to an individual player
 """
 
-"""
-Imports
-"""
-from copy import deepcopy
-
 class Player:
+    """
+    Constants
+    """
+    NAME_STR = "Player %d"
+
     """
     Static Variables
     """
@@ -17,29 +17,34 @@ class Player:
     """
     Constructor
     """
-    def __init__(self):
+    def __init__(self, player_id=None):
         """
         Increment the number of players created counter
+        A player rebuilt from a saved game keeps its ID (and later players are numbered after it)
         """
-        Player._count += 1
+        if player_id is None:
+            Player._count   += 1
+            player_id       = Player._count
+        else:
+            Player._count   = max(Player._count, player_id)
 
         """
         Public Constant Properties
         """
-        self.ID = Player._count     ### Player's unique unchanging identification value
+        self.ID = player_id         ### Player's unique unchanging identification value
 
         """
         Private Properties
         """
         self._action        = 0         ### Money placed directly in front of the player ("bet" money)
-        self._hole_cards    = list()    ### Received cards for a hand
+        self._hole_cards    = tuple()   ### Received cards for a hand (replaced rather than changed, so a snapshot can share it)
         self._stack         = 0         ### Current chip count
 
     """
     String Overrides
     """
     def __str__(self):
-        return "Player %d" % self.ID
+        return Player.NAME_STR % self.ID
 
     """
     Getter Methods
@@ -48,7 +53,7 @@ class Player:
         return self._action
 
     def get_hole_cards(self):
-        return deepcopy(self._hole_cards)
+        return list(self._hole_cards)
 
     def get_stack_size(self):
         return self._stack
@@ -57,10 +62,10 @@ class Player:
     Hole Card Setters
     """
     def take_hole_card(self, card):
-        self._hole_cards.append(card)
+        self._hole_cards = ( *self._hole_cards, card )
 
     def pass_hole_cards(self):
-        self._hole_cards.clear()
+        self._hole_cards = tuple()
 
     """
     Chip Stack and Action Setter Methods
@@ -103,3 +108,4 @@ class Player:
         Add the passed value into the stack
         """
         self._stack += num_received
+
@@ -0,0 +1,78 @@
+"""
+PlayerView:
+    Immutable snapshot of a player's public data (and hole cards, if they may be seen)
+    A view only holds four values, so it is cheap to build and can be shared freely, unlike a copy of a Player
+    It has the same ID, string form, and getter methods as Player so it can be displayed the same way
+"""
+
+"""
+Imports
+"""
+from player import Player
+
+class PlayerView:
+    """
+    Constants
+    """
+    EXCEPTION_IMMUTABLE = "Player views cannot be modified"
+
+    """
+    Slots
+    """
+    __slots__ = ("ID", "_stack", "_action", "_hole_cards")
+
+    """
+    Constructor
+    """
+    def __init__(self, player_id, stack, action, hole_cards=tuple()):
+        """
+        Properties
+        """
+        object.__setattr__(self, "ID",          player_id)          ### Player's unique unchanging identification value
+        object.__setattr__(self, "_stack",      stack)              ### Chip count
+        object.__setattr__(self, "_action",     action)             ### Money placed directly in front of the player
+        object.__setattr__(self, "_hole_cards", tuple(hole_cards))  ### Hole cards (empty if they may not be seen)
+
+    """
+    Static Methods
+    """
+    @staticmethod
+    def from_player(player, show_hole_cards=True):
+        """
+        Take a snapshot of a player (the hole cards are left out if they should not be seen)
+        """
+        hole_cards = player.get_hole_cards() if show_hole_cards else tuple()
+        return PlayerView(player.ID, player.get_stack_size(), player.get_action(), hole_cards)
+
+    """
+    Overrides
+    """
+    def __str__(self):
+        return Player.NAME_STR % self.ID
+
+    def __setattr__(self, name, value):
+        """
+        Player views are immutable
+        """
+        raise AttributeError(PlayerView.EXCEPTION_IMMUTABLE)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (PlayerView, (self.ID, self._stack, self._action, self._hole_cards))
+
+    """
+    Getter Methods
+    """
+    def get_action(self):
+        return self._action
+
+    def get_hole_cards(self):
+        return list(self._hole_cards)
+
+    def get_stack_size(self):
+        return self._stack
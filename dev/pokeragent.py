@@ -0,0 +1,47 @@
+"""
+PokerAgent:
+    Interface for anything that can sit at a seat and choose moves (a human, a scripted bot, an AI)
+
+    Before each of its moves, an agent receives a GameView of the table, the available moves, and the
+    required bet or raise amount, and returns a (move, amount) pair
+    The amount is only used for bets and raises (None means the required amount)
+    Every agent also observes every move made at the table
+"""
+
+"""
+Imports
+"""
+from gamemove import GameMove
+
+class PokerAgent:
+    """
+    Constants
+    """
+    TIME_LIMITED = True     ### Is the agent's decision time capped? (a human at the terminal is not)
+    USES_EQUITY  = False    ### Should the game estimate the agent's equity before each of its moves? (see GameView.equity)
+
+    """
+    Static Methods
+    """
+    @staticmethod
+    def get_passive_move(available_moves):
+        """
+        Get the move that risks no more chips: check if possible, fold otherwise
+        """
+        return (GameMove.CHECK, None) if GameMove.CHECK in available_moves else (GameMove.FOLD, None)
+
+    """
+    Public Methods
+    """
+    def choose_move(self, view, available_moves, action_to_play):
+        """
+        Choose a move from the available moves (agents must override this)
+        The default is to check if possible and fold otherwise
+        """
+        return PokerAgent.get_passive_move(available_moves)
+
+    def observe(self, player_id, move, amount):
+        """
+        See a move made by any player at the table (including this agent's own moves)
+        """
+        pass
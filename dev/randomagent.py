@@ -0,0 +1,27 @@
+"""
+RandomAgent:
+    Bot that picks one of the available moves at random (bets and raises are for the required amount)
+"""
+
+"""
+Imports
+"""
+from random     import Random
+
+from pokeragent import PokerAgent
+
+class RandomAgent(PokerAgent):
+    """
+    Constructor
+    """
+    def __init__(self, seed=None):
+        """
+        Properties
+        """
+        self._rng = Random(seed)    ### Random number generator used to pick moves
+
+    """
+    Public Methods
+    """
+    def choose_move(self, view, available_moves, action_to_play):
+        return (self._rng.choice(available_moves), action_to_play)
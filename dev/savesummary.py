@@ -0,0 +1,32 @@
+"""
+SaveSummary:
+    Immutable summary of a saved game, kept in a fixed-size block at the start of a save file (see GameSave)
+    It can be read without loading (or even reading past the start of) the save file, so many save files can be
+    listed or checked for completion quickly
+"""
+
+"""
+Imports
+"""
+from collections import namedtuple
+
+class SaveSummary(namedtuple("SaveSummary", [
+    "num_hands",        ### Number of hands played
+    "num_players",      ### Number of players left in the game
+    "complete",         ### Is the game complete (only one player left)?
+    "round_number",     ### Round number of the most recent hand (number of blind levels)
+    "timestamp"         ### Blind timer timestamp after the most recent hand (None if there is none)
+])):
+    """
+    Tuple Layout
+    """
+    __slots__ = ()
+
+    """
+    Getter Methods
+    """
+    def is_game_complete(self):
+        return self.complete
+
+    def is_game_started(self):
+        return self.num_hands > 0
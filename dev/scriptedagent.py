@@ -0,0 +1,39 @@
+"""
+ScriptedAgent:
+    Bot that plays a fixed sequence of (move, amount) pairs in order
+    A scripted move that is not available, or any move after the script runs out, is replaced by a check or fold
+"""
+
+"""
+Imports
+"""
+from pokeragent import PokerAgent
+
+class ScriptedAgent(PokerAgent):
+    """
+    Constructor
+    """
+    def __init__(self, script=list()):
+        """
+        Properties
+        """
+        self._script        = list(script)  ### (move, amount) pairs to play
+        self._script_idx    = 0             ### Position of the next move to play in the script
+
+    """
+    Public Methods
+    """
+    def choose_move(self, view, available_moves, action_to_play):
+        chosen_move = PokerAgent.get_passive_move(available_moves)
+
+        if self._script_idx < len(self._script):
+            move, amount        = self._script[self._script_idx]
+            self._script_idx    += 1
+
+            if move in available_moves:
+                chosen_move = (move, amount)
+
+        """
+        Return Result
+        """
+        return chosen_move
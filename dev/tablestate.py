@@ -0,0 +1,251 @@
+"""
+TableState:
+    Compact array-backed state of the players at a table (structure of arrays)
+    Every per-seat value (player ID, stack, action, turn flag, hole cards) is kept in one column of a single flat buffer
+    indexed by seat, and the dealer is a seat offset stored in the same buffer instead of a rotation of the players
+
+    Positions are counted from the dealer (the dealer is at position 0), so moving the button only changes the offset
+    Copying the state (e.g. to take back moves in a search) is a single buffer copy, and each column can be read
+    as a whole (e.g. numpy.frombuffer(state.get_column(TableState.STACK)) for vectorized queries)
+"""
+
+"""
+Imports
+"""
+from array      import array
+
+from card       import Card
+from playerview import PlayerView
+
+class TableState:
+    """
+    Constants
+    """
+    BUFFER_TYPECODE = "d"   ### Every value is stored as a double (chip counts may be fractional after split pots)
+    NUM_HOLE_CARDS  = 2     ### Number of hole card columns per seat
+    NO_CARD         = -1    ### Card index of an empty hole card slot
+
+    """
+    Columns (the buffer holds each column for every seat, one column after another, then the dealer seat)
+    """
+    PLAYER_ID   = 0                         ### ID of the player in the seat
+    STACK       = 1                         ### Chip count
+    ACTION      = 2                         ### Money placed directly in front of the player
+    MOVED       = 3                         ### 1 if the player has had a turn in the current betting round, 0 otherwise
+    HOLE_CARD   = 4                         ### Card index of the first hole card (the next columns hold the others)
+    NUM_COLUMNS = HOLE_CARD + NUM_HOLE_CARDS
+
+    EXCEPTION_NO_HOLE_SLOT = "Seat %d already holds %d hole cards"
+
+    """
+    Static Variables
+    """
+    _player_count = 0   ### Number of player IDs given out (a player seated from a saved game keeps its ID and later players are numbered after it)
+
+    """
+    Constructor
+    """
+    def __init__(self, num_seats, buffer=None):
+        """
+        Properties
+        """
+        self._num_seats = num_seats     ### Number of seats at the table
+        self._buffer    = buffer        ### Columns of every seat followed by the dealer seat
+
+        """
+        Create an empty table (no chips, no cards, dealer in seat 0) if no buffer was given
+        """
+        if self._buffer is None:
+            self._buffer = array(TableState.BUFFER_TYPECODE, [ 0 ]) * ( num_seats * TableState.NUM_COLUMNS + 1 )
+
+            for seat in range(num_seats):
+                self.pass_hole_cards(seat)
+
+    """
+    Overrides
+    """
+    def __copy__(self):
+        return self.clone()
+
+    def __deepcopy__(self, memo):
+        return self.clone()
+
+    """
+    Getter Methods
+    """
+    def get_num_seats(self):
+        return self._num_seats
+
+    def get_column(self, column):
+        """
+        Get a read-only view of a column (one value per seat)
+        """
+        start = column * self._num_seats
+        return memoryview(self._buffer).toreadonly()[ start : start + self._num_seats ]
+
+    def get_dealer_seat(self):
+        return int(self._buffer[-1])
+
+    def get_seat(self, position):
+        """
+        Get the seat of a position relative to the dealer (the dealer is at position 0)
+        """
+        return ( int(self._buffer[-1]) + position ) % self._num_seats
+
+    def get_position(self, seat):
+        """
+        Get the position of a seat relative to the dealer
+        """
+        return ( seat - int(self._buffer[-1]) ) % self._num_seats
+
+    def get_seats(self):
+        """
+        Get every seat in order of position (starting with the dealer)
+        """
+        dealer_seat = int(self._buffer[-1])
+        return [ *range(dealer_seat, self._num_seats), *range(dealer_seat) ]
+
+    def get_player_id(self, seat):
+        return int(self._buffer[ TableState.PLAYER_ID * self._num_seats + seat ])
+
+    def get_stack_size(self, seat):
+        return self._buffer[ TableState.STACK * self._num_seats + seat ]
+
+    def get_action(self, seat):
+        return self._buffer[ TableState.ACTION * self._num_seats + seat ]
+
+    def has_moved(self, seat):
+        return self._buffer[ TableState.MOVED * self._num_seats + seat ] == 1
+
+    def get_hole_cards(self, seat):
+        """
+        Get the hole cards held in a seat
+        """
+        first_slot  = TableState.HOLE_CARD * self._num_seats + seat
+        last_slot   = first_slot + TableState.NUM_HOLE_CARDS * self._num_seats
+
+        """
+        Return Result
+        """
+        return [ Card.from_index(int(card_idx)) for card_idx in self._buffer[ first_slot : last_slot : self._num_seats ] if card_idx != TableState.NO_CARD ]
+
+    def get_player_view(self, seat, show_hole_cards=True):
+        """
+        Get an immutable view of the player in a seat (the hole cards are left out if they should not be seen)
+        """
+        buffer      = self._buffer
+        num_seats   = self._num_seats
+        hole_cards  = self.get_hole_cards(seat) if show_hole_cards else tuple()
+
+        return PlayerView(int(buffer[ TableState.PLAYER_ID * num_seats + seat ]), buffer[ TableState.STACK * num_seats + seat ], buffer[ TableState.ACTION * num_seats + seat ], hole_cards)
+
+    """
+    Setter Methods
+    """
+    def seat_player(self, seat, stack, player_id=None):
+        """
+        Seat a player with the given stack (a new player gets the next player ID)
+        """
+        if player_id is None:
+            TableState._player_count    += 1
+            player_id                   = TableState._player_count
+        else:
+            TableState._player_count    = max(TableState._player_count, player_id)
+
+        self._buffer[ TableState.PLAYER_ID * self._num_seats + seat ]   = player_id
+        self._buffer[ TableState.STACK * self._num_seats + seat ]       = stack
+
+    def set_dealer_seat(self, seat):
+        self._buffer[-1] = seat % self._num_seats
+
+    def set_moved(self, seat, moved=True):
+        self._buffer[ TableState.MOVED * self._num_seats + seat ] = int(moved)
+
+    def take_hole_card(self, seat, card):
+        """
+        Give a card to the player in a seat (in the first empty hole card slot)
+        """
+        for card_num in range(TableState.NUM_HOLE_CARDS):
+            card_slot = ( TableState.HOLE_CARD + card_num ) * self._num_seats + seat
+
+            if self._buffer[card_slot] == TableState.NO_CARD:
+                self._buffer[card_slot] = card.get_index()
+                return
+
+        raise Exception(TableState.EXCEPTION_NO_HOLE_SLOT % (seat, TableState.NUM_HOLE_CARDS))
+
+    def pass_hole_cards(self, seat):
+        for card_num in range(TableState.NUM_HOLE_CARDS):
+            self._buffer[ ( TableState.HOLE_CARD + card_num ) * self._num_seats + seat ] = TableState.NO_CARD
+
+    """
+    Chip Stack and Action Setter Methods
+    """
+    def bet(self, seat, num_to_bet):
+        """
+        Move chips from a seat's stack to its action (never more than the stack) and return the number of chips bet
+        """
+        stack_slot  = TableState.STACK * self._num_seats + seat
+        num_to_bet  = min(num_to_bet, self._buffer[stack_slot])
+
+        self._buffer[stack_slot]                                        -= num_to_bet
+        self._buffer[ TableState.ACTION * self._num_seats + seat ]      += num_to_bet
+
+        """
+        Return Result
+        """
+        return num_to_bet
+
+    def release_action(self, seat, amount=None):
+        """
+        Take chips from a seat's action (default: all of it) and return the number of chips released
+        """
+        action_slot     = TableState.ACTION * self._num_seats + seat
+        action_released = amount if amount is not None and amount <= self._buffer[action_slot] else self._buffer[action_slot]
+
+        self._buffer[action_slot] -= action_released
+
+        """
+        Return Result
+        """
+        return action_released
+
+    def collect_chips(self, seat, num_received):
+        self._buffer[ TableState.STACK * self._num_seats + seat ] += num_received
+
+    """
+    Public Methods
+    """
+    def clone(self):
+        """
+        Copy the state (a single copy of the buffer)
+        """
+        return TableState(self._num_seats, self._buffer[:])
+
+    def copy_from(self, other):
+        """
+        Overwrite the state with a copy of another state (a single copy of its buffer)
+        """
+        self._num_seats     = other._num_seats
+        self._buffer[:]     = other._buffer
+
+    def without_seats(self, removed_seats):
+        """
+        Get a copy of the state without the players in the given seats (the other players keep their order)
+        The dealer button stays in place: it goes to the first remaining player at or after the dealer's seat
+        """
+        kept_seats  = [ seat for seat in range(self._num_seats) if seat not in removed_seats ]
+        state       = TableState(len(kept_seats))
+
+        for new_seat, seat in enumerate(kept_seats):
+
+            for column in range(TableState.NUM_COLUMNS):
+                state._buffer[ column * state._num_seats + new_seat ] = self._buffer[ column * self._num_seats + seat ]
+
+        dealer_seat = next(seat for seat in self.get_seats() if seat not in removed_seats)
+        state.set_dealer_seat(kept_seats.index(dealer_seat))
+
+        """
+        Return Result
+        """
+        return state
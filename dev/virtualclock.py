@@ -0,0 +1,55 @@
+"""
+VirtualClock:
+    Game clock for simulations: time only passes when the clock is advanced (e.g. a set number of seconds per hand or per action)
+    Scheduled callbacks are called synchronously (in the order they are due) by the advance that reaches them,
+    so no threads are created and a full blind structure can be played in milliseconds
+"""
+
+"""
+Imports
+"""
+from heapq      import heappop, heappush
+
+from gameclock  import GameClock
+
+class VirtualClock(GameClock):
+    """
+    Constructor
+    """
+    def __init__(self, start_time=0):
+        """
+        Properties
+        """
+        self._callbacks     = list()        ### Heap of (due time, scheduling order, callback) of every callback not yet called
+        self._num_scheduled = 0             ### Number of callbacks scheduled so far (keeps callbacks due at the same time in order)
+        self._time          = start_time    ### Current virtual time in seconds
+
+    """
+    GameClock Overrides
+    """
+    def get_time(self):
+        return self._time
+
+    def call_later(self, delay, callback):
+        """
+        Schedule the callback function to be called when the clock is advanced past the given number of seconds
+        """
+        heappush(self._callbacks, ( self._time + delay, self._num_scheduled, callback ))
+        self._num_scheduled += 1
+
+    """
+    Public Methods
+    """
+    def advance(self, seconds):
+        """
+        Move the clock forward, calling every callback that becomes due along the way
+        The clock reads each callback's due time while it is called (so callbacks that schedule more callbacks are timed correctly)
+        """
+        end_time = self._time + seconds
+
+        while len(self._callbacks) > 0 and self._callbacks[0][0] <= end_time:
+            due_time, _, callback   = heappop(self._callbacks)
+            self._time              = max(self._time, due_time)
+            callback()
+
+        self._time = end_time